@@ -11,6 +11,7 @@ This module provides chess position evaluation including:
 
 import chess
 import random
+from typing import List, Optional
 
 
 # Standard piece values in centipawns (1 pawn = 100)
@@ -40,6 +41,25 @@ BLACK_KNIGHT_START = [chess.B8, chess.G8]
 WHITE_BISHOP_START = [chess.C1, chess.F1]
 BLACK_BISHOP_START = [chess.C8, chess.F8]
 
+# Pawn-structure masks, so whole files of pawns are tested with one AND
+# Files next to each file (for isolated pawns)
+ADJACENT_FILES = [
+    (chess.BB_FILES[f - 1] if f > 0 else 0) | (chess.BB_FILES[f + 1] if f < 7 else 0)
+    for f in range(8)
+]
+# Squares an enemy pawn must be absent from for a pawn on each square to be passed:
+# same and adjacent files, strictly ahead (toward rank 8 for White, rank 1 for Black)
+WHITE_PASSED_MASKS = [
+    (chess.BB_FILES[chess.square_file(sq)] | ADJACENT_FILES[chess.square_file(sq)])
+    & (chess.BB_ALL << (8 * (chess.square_rank(sq) + 1))) & chess.BB_ALL
+    for sq in chess.SQUARES
+]
+BLACK_PASSED_MASKS = [
+    (chess.BB_FILES[chess.square_file(sq)] | ADJACENT_FILES[chess.square_file(sq)])
+    & ((1 << (8 * chess.square_rank(sq))) - 1)
+    for sq in chess.SQUARES
+]
+
 
 def evaluate_material(board: chess.Board) -> int:
     """
@@ -63,17 +83,15 @@ def evaluate_material(board: chess.Board) -> int:
         >>> evaluate_material(board)
         -100
     """
+    # Count pieces with bitboard popcounts instead of visiting all 64 squares
+    white = board.occupied_co[chess.WHITE]
+    black = board.occupied_co[chess.BLACK]
     score = 0
-
-    # Count all pieces on the board
-    for square in chess.SQUARES:
-        piece = board.piece_at(square)
-        if piece is not None:
-            value = PIECE_VALUES[piece.piece_type]
-            if piece.color == chess.WHITE:
-                score += value
-            else:
-                score -= value
+    for piece_type, bitboard in ((chess.PAWN, board.pawns), (chess.KNIGHT, board.knights),
+                                 (chess.BISHOP, board.bishops), (chess.ROOK, board.rooks),
+                                 (chess.QUEEN, board.queens)):
+        score += PIECE_VALUES[piece_type] * (chess.popcount(bitboard & white) -
+                                             chess.popcount(bitboard & black))
 
     return score
 
@@ -270,124 +288,38 @@ def evaluate_pawn_structure(board: chess.Board) -> int:
         Score in centipawns (positive = White advantage)
     """
     score = 0
+    white_pawns = board.pawns & board.occupied_co[chess.WHITE]
+    black_pawns = board.pawns & board.occupied_co[chess.BLACK]
 
-    # Analyze each file for pawn structure
+    # Analyze each file for pawn structure (bitboard masks instead of square scans)
     for file in range(8):
-        white_pawns_on_file = []
-        black_pawns_on_file = []
-
-        for rank in range(8):
-            square = chess.square(file, rank)
-            piece = board.piece_at(square)
-            if piece and piece.piece_type == chess.PAWN:
-                if piece.color == chess.WHITE:
-                    white_pawns_on_file.append(rank)
-                else:
-                    black_pawns_on_file.append(rank)
+        white_on_file = white_pawns & chess.BB_FILES[file]
+        black_on_file = black_pawns & chess.BB_FILES[file]
+        white_count = chess.popcount(white_on_file)
+        black_count = chess.popcount(black_on_file)
 
         # Doubled pawns penalty
-        if len(white_pawns_on_file) > 1:
-            score -= 20 * (len(white_pawns_on_file) - 1)
-        if len(black_pawns_on_file) > 1:
-            score += 20 * (len(black_pawns_on_file) - 1)
+        if white_count > 1:
+            score -= 20 * (white_count - 1)
+        if black_count > 1:
+            score += 20 * (black_count - 1)
 
         # Isolated pawns (no friendly pawns on adjacent files)
-        if white_pawns_on_file:
-            has_support = False
-            if file > 0:
-                for rank in range(8):
-                    square = chess.square(file - 1, rank)
-                    piece = board.piece_at(square)
-                    if piece and piece.piece_type == chess.PAWN and piece.color == chess.WHITE:
-                        has_support = True
-                        break
-            if file < 7 and not has_support:
-                for rank in range(8):
-                    square = chess.square(file + 1, rank)
-                    piece = board.piece_at(square)
-                    if piece and piece.piece_type == chess.PAWN and piece.color == chess.WHITE:
-                        has_support = True
-                        break
-            if not has_support:
-                score -= 15 * len(white_pawns_on_file)  # Isolated pawn penalty
-
-        if black_pawns_on_file:
-            has_support = False
-            if file > 0:
-                for rank in range(8):
-                    square = chess.square(file - 1, rank)
-                    piece = board.piece_at(square)
-                    if piece and piece.piece_type == chess.PAWN and piece.color == chess.BLACK:
-                        has_support = True
-                        break
-            if file < 7 and not has_support:
-                for rank in range(8):
-                    square = chess.square(file + 1, rank)
-                    piece = board.piece_at(square)
-                    if piece and piece.piece_type == chess.PAWN and piece.color == chess.BLACK:
-                        has_support = True
-                        break
-            if not has_support:
-                score += 15 * len(black_pawns_on_file)
+        if white_count and not white_pawns & ADJACENT_FILES[file]:
+            score -= 15 * white_count  # Isolated pawn penalty
+        if black_count and not black_pawns & ADJACENT_FILES[file]:
+            score += 15 * black_count
 
         # Passed pawns bonus (simplified: no enemy pawns on same file or adjacent files ahead)
-        for white_rank in white_pawns_on_file:
-            is_passed = True
-            # Check same file ahead
-            for check_rank in range(white_rank + 1, 8):
-                square = chess.square(file, check_rank)
-                piece = board.piece_at(square)
-                if piece and piece.piece_type == chess.PAWN and piece.color == chess.BLACK:
-                    is_passed = False
-                    break
-            # Check adjacent files ahead
-            if is_passed and file > 0:
-                for check_rank in range(white_rank + 1, 8):
-                    square = chess.square(file - 1, check_rank)
-                    piece = board.piece_at(square)
-                    if piece and piece.piece_type == chess.PAWN and piece.color == chess.BLACK:
-                        is_passed = False
-                        break
-            if is_passed and file < 7:
-                for check_rank in range(white_rank + 1, 8):
-                    square = chess.square(file + 1, check_rank)
-                    piece = board.piece_at(square)
-                    if piece and piece.piece_type == chess.PAWN and piece.color == chess.BLACK:
-                        is_passed = False
-                        break
-
-            if is_passed:
+        for square in chess.scan_forward(white_on_file):
+            if not black_pawns & WHITE_PASSED_MASKS[square]:
                 # Bonus increases as pawn advances
-                score += 20 + (white_rank * 10)
-
-        for black_rank in black_pawns_on_file:
-            is_passed = True
-            # Check same file ahead (for black, "ahead" is toward rank 0)
-            for check_rank in range(black_rank - 1, -1, -1):
-                square = chess.square(file, check_rank)
-                piece = board.piece_at(square)
-                if piece and piece.piece_type == chess.PAWN and piece.color == chess.WHITE:
-                    is_passed = False
-                    break
-            # Check adjacent files ahead
-            if is_passed and file > 0:
-                for check_rank in range(black_rank - 1, -1, -1):
-                    square = chess.square(file - 1, check_rank)
-                    piece = board.piece_at(square)
-                    if piece and piece.piece_type == chess.PAWN and piece.color == chess.WHITE:
-                        is_passed = False
-                        break
-            if is_passed and file < 7:
-                for check_rank in range(black_rank - 1, -1, -1):
-                    square = chess.square(file + 1, check_rank)
-                    piece = board.piece_at(square)
-                    if piece and piece.piece_type == chess.PAWN and piece.color == chess.WHITE:
-                        is_passed = False
-                        break
-
-            if is_passed:
+                score += 20 + (chess.square_rank(square) * 10)
+
+        for square in chess.scan_forward(black_on_file):
+            if not white_pawns & BLACK_PASSED_MASKS[square]:
                 # Bonus increases as pawn advances (for black, lower rank = more advanced)
-                score -= 20 + ((7 - black_rank) * 10)
+                score -= 20 + ((7 - chess.square_rank(square)) * 10)
 
     return score
 
@@ -457,7 +389,32 @@ def evaluate(board: chess.Board) -> int:
     return score
 
 
-def best_move_material(board: chess.Board) -> chess.Move:
+def evaluate_moves(board: chess.Board, moves: List[chess.Move]) -> List[int]:
+    """
+    Evaluate the positions reached by each of several moves.
+
+    Equivalent to [evaluate(position after move) for move in moves], but the
+    moves are played and taken back on the given board instead of on copies.
+
+    Args:
+        board: Position the moves are played from (left unchanged)
+        moves: Legal moves in that position
+
+    Returns:
+        Score of each resulting position in centipawns from White's perspective
+    """
+    scores = []
+    for move in moves:
+        board.push(move)
+        try:
+            scores.append(evaluate(board))
+        finally:
+            board.pop()
+
+    return scores
+
+
+def best_move_material(board: chess.Board, rng: Optional[random.Random] = None) -> chess.Move:
     """
     Find the best move based on material evaluation only.
 
@@ -466,6 +423,7 @@ def best_move_material(board: chess.Board) -> chess.Move:
 
     Args:
         board: Current chess position
+        rng: Random number generator for breaking ties (default: the global random module)
 
     Returns:
         The move with the best material outcome
@@ -481,15 +439,7 @@ def best_move_material(board: chess.Board) -> chess.Move:
         return None
 
     # Collect all moves with their scores
-    move_scores = []
-    for move in legal_moves:
-        # Make the move on a copy
-        board_copy = board.copy()
-        board_copy.push(move)
-
-        # Evaluate the resulting position
-        score = evaluate(board_copy)
-        move_scores.append((move, score))
+    move_scores = list(zip(legal_moves, evaluate_moves(board, legal_moves)))
 
     # Find best score
     if board.turn == chess.WHITE:
@@ -500,7 +450,7 @@ def best_move_material(board: chess.Board) -> chess.Move:
         best_moves = [move for move, score in move_scores if score == best_score]
 
     # Randomly pick among best moves (adds variety)
-    return random.choice(best_moves)
+    return (rng if rng is not None else random).choice(best_moves)
 
 
 if __name__ == "__main__":
@@ -28,6 +28,9 @@ import chess
 import random
 import math
 import time
+import multiprocessing
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from typing import Optional, List
 import sys
 import os
@@ -35,7 +38,7 @@ import os
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from engine.evaluator import evaluate, PIECE_VALUES
+from engine.evaluator import evaluate, evaluate_moves, PIECE_VALUES
 
 
 def hangs_material(board: chess.Board, move: chess.Move, threshold: int = 300) -> bool:
@@ -98,7 +101,8 @@ class MCTSNode:
     """
 
     def __init__(self, board: chess.Board, parent: Optional['MCTSNode'] = None,
-                 move: Optional[chess.Move] = None, filter_blunders: bool = True):
+                 move: Optional[chess.Move] = None, filter_blunders: bool = True,
+                 rng: Optional[random.Random] = None):
         """
         Initialize a new MCTS node.
 
@@ -107,11 +111,14 @@ class MCTSNode:
             parent: Parent node (None for root)
             move: The move that led to this position (None for root)
             filter_blunders: If True, filter out moves that hang pieces (default: True)
+            rng: Random number generator for move ordering, inherited by children
+                 (default: the global random module)
         """
         self.board = board.copy()
         self.parent = parent
         self.move = move  # Move that led to this position
         self.filter_blunders = filter_blunders
+        self.rng = rng if rng is not None else random
 
         # MCTS statistics
         self.visit_count = 0
@@ -130,7 +137,7 @@ class MCTSNode:
         else:
             self.untried_moves = all_moves
 
-        random.shuffle(self.untried_moves)  # Randomize order to avoid bias
+        self.rng.shuffle(self.untried_moves)  # Randomize order to avoid bias
 
     def is_fully_expanded(self) -> bool:
         """Check if all legal moves have been tried."""
@@ -218,13 +225,15 @@ class MCTSNode:
         new_board.push(move)
 
         # Create child node
-        child = MCTSNode(new_board, parent=self, move=move, filter_blunders=self.filter_blunders)
+        child = MCTSNode(new_board, parent=self, move=move, filter_blunders=self.filter_blunders,
+                         rng=self.rng)
         self.children[move] = child
 
         return child
 
 
-def simulate_random(board: chess.Board, max_moves: int = 200) -> float:
+def simulate_random(board: chess.Board, max_moves: int = 200,
+                    rng: Optional[random.Random] = None) -> float:
     """
     Simulate a random game from the given position (random rollout).
 
@@ -234,6 +243,7 @@ def simulate_random(board: chess.Board, max_moves: int = 200) -> float:
     Args:
         board: Starting position
         max_moves: Maximum moves to simulate (prevents infinite games)
+        rng: Random number generator (default: the global random module)
 
     Returns:
         Game result from White's perspective:
@@ -241,6 +251,8 @@ def simulate_random(board: chess.Board, max_moves: int = 200) -> float:
         -1.0 = Black wins
          0.0 = Draw
     """
+    if rng is None:
+        rng = random
     sim_board = board.copy()
     moves = 0
 
@@ -249,7 +261,7 @@ def simulate_random(board: chess.Board, max_moves: int = 200) -> float:
         legal_moves = list(sim_board.legal_moves)
         if not legal_moves:
             break
-        move = random.choice(legal_moves)
+        move = rng.choice(legal_moves)
         sim_board.push(move)
         moves += 1
 
@@ -263,7 +275,8 @@ def simulate_random(board: chess.Board, max_moves: int = 200) -> float:
 
 
 def get_prioritized_moves(board: chess.Board, legal_moves: List[chess.Move],
-                          sample_size: int) -> List[chess.Move]:
+                          sample_size: int,
+                          rng: Optional[random.Random] = None) -> List[chess.Move]:
     """
     Intelligently sample moves, prioritizing forcing moves over quiet moves.
 
@@ -280,12 +293,15 @@ def get_prioritized_moves(board: chess.Board, legal_moves: List[chess.Move],
         board: Current board position
         legal_moves: List of all legal moves
         sample_size: Target number of moves to sample
+        rng: Random number generator (default: the global random module)
 
     Returns:
         List of prioritized moves (forcing moves + sample of quiet moves)
     """
     if len(legal_moves) <= sample_size:
         return legal_moves
+    if rng is None:
+        rng = random
 
     forcing = []  # Captures + promotions (+ checks for extra tactics)
     quiet = []
@@ -302,7 +318,7 @@ def get_prioritized_moves(board: chess.Board, legal_moves: List[chess.Move],
     # Then fill remaining slots with quiet moves
     if len(forcing) >= sample_size:
         # Too many forcing moves - sample from them
-        return random.sample(forcing, sample_size)
+        return rng.sample(forcing, sample_size)
     else:
         # Take all forcing moves + sample quiet moves to reach sample_size
         sampled = forcing.copy()
@@ -310,13 +326,14 @@ def get_prioritized_moves(board: chess.Board, legal_moves: List[chess.Move],
 
         if remaining_slots > 0 and quiet:
             num_quiet = min(remaining_slots, len(quiet))
-            sampled.extend(random.sample(quiet, num_quiet))
+            sampled.extend(rng.sample(quiet, num_quiet))
 
         return sampled if sampled else legal_moves
 
 
 def simulate_with_evaluator(board: chess.Board, max_moves: int = 50,
-                            sample_size: int = 10) -> float:
+                            sample_size: int = 10,
+                            rng: Optional[random.Random] = None) -> float:
     """
     Simulate a game using the evaluator for guidance (smart rollout).
 
@@ -333,6 +350,7 @@ def simulate_with_evaluator(board: chess.Board, max_moves: int = 50,
         max_moves: Maximum moves to simulate (shorter than random since it's slower)
         sample_size: Number of moves to evaluate per position (default: 10)
                     Lower = faster but less accurate, Higher = slower but more accurate
+        rng: Random number generator for move sampling (default: the global random module)
 
     Returns:
         Game result estimate from White's perspective (-1.0 to +1.0)
@@ -347,17 +365,13 @@ def simulate_with_evaluator(board: chess.Board, max_moves: int = 50,
 
         # OPTIMIZATION 1: Sample subset of moves (3-5x speedup)
         # OPTIMIZATION 2: Prioritize forcing moves (better accuracy, enables smaller sample_size)
-        moves_to_evaluate = get_prioritized_moves(sim_board, legal_moves, sample_size)
+        moves_to_evaluate = get_prioritized_moves(sim_board, legal_moves, sample_size, rng)
 
         # Pick move with simple 1-ply evaluation from sampled moves
         best_move = None
         best_eval = float('-inf') if sim_board.turn == chess.WHITE else float('inf')
 
-        for move in moves_to_evaluate:
-            sim_board.push(move)
-            eval_score = evaluate(sim_board)
-            sim_board.pop()
-
+        for move, eval_score in zip(moves_to_evaluate, evaluate_moves(sim_board, moves_to_evaluate)):
             if sim_board.turn == chess.WHITE:
                 if eval_score > best_eval:
                     best_eval = eval_score
@@ -403,12 +417,57 @@ def backpropagate(node: MCTSNode, value: float):
         node = node.parent
 
 
+def subtree_for(root: Optional[MCTSNode], board: chess.Board,
+                filter_blunders: bool = True,
+                rng: Optional[random.Random] = None) -> MCTSNode:
+    """
+    Find the node for the current position in a previous search tree.
+
+    Between two moves of a game the position usually extends the previous
+    root's by a few moves (ours and the opponent's reply). Following those
+    moves down the old tree recovers the statistics already gathered for the
+    current position, so they are not thrown away.
+
+    Args:
+        root: Root of the previous search (or None)
+        board: Current position
+        filter_blunders: Passed to a fresh root if the tree can't be reused
+        rng: Passed to a fresh root if the tree can't be reused
+
+    Returns:
+        The matching node, detached from its parent to serve as the new
+        root, or a fresh root node if the position isn't in the tree
+    """
+    node = root
+    if node is not None:
+        old_stack = node.board.move_stack
+        new_stack = board.move_stack
+        n = len(old_stack)
+        if len(new_stack) >= n and new_stack[:n] == old_stack:
+            for move in new_stack[n:]:
+                node = node.children.get(move)
+                if node is None:
+                    break
+        else:
+            node = None
+
+    # Same moves from a different start position don't count
+    if node is None or node.board._transposition_key() != board._transposition_key():
+        return MCTSNode(board, filter_blunders=filter_blunders, rng=rng)
+
+    node.parent = None  # New root: lets the rest of the old tree be freed
+    return node
+
+
 def mcts_search(board: chess.Board, simulations: int = 200,
                 use_evaluator: bool = True,
                 exploration_constant: float = 1.41,
                 sample_size: int = 10,
                 filter_blunders: bool = True,
-                verbose: bool = False) -> Optional[chess.Move]:
+                verbose: bool = False,
+                root: Optional[MCTSNode] = None,
+                stop_event=None,
+                rng: Optional[random.Random] = None) -> Optional[chess.Move]:
     """
     Perform MCTS search to find the best move.
 
@@ -430,6 +489,12 @@ def mcts_search(board: chess.Board, simulations: int = 200,
         sample_size: Number of moves to evaluate in rollouts (default: 10)
         filter_blunders: If True, filter moves that hang pieces (default: True)
         verbose: Print search statistics
+        root: Optional existing root node for this position (see subtree_for);
+              the simulations are added to its tree
+        stop_event: Optional threading.Event; once set, the search stops after
+                    the current simulation and returns the best move so far
+        rng: Random number generator for the whole search, so a seeded one
+             makes it reproducible (default: the global random module)
 
     Returns:
         Best move found, or None if no legal moves
@@ -438,7 +503,8 @@ def mcts_search(board: chess.Board, simulations: int = 200,
         return None
 
     # Create root node
-    root = MCTSNode(board, filter_blunders=filter_blunders)
+    if root is None:
+        root = MCTSNode(board, filter_blunders=filter_blunders, rng=rng)
 
     start_time = time.time()
 
@@ -459,9 +525,9 @@ def mcts_search(board: chess.Board, simulations: int = 200,
 
         # 3. SIMULATION - Play out game
         if use_evaluator:
-            value = simulate_with_evaluator(search_board, sample_size=sample_size)
+            value = simulate_with_evaluator(search_board, sample_size=sample_size, rng=rng)
         else:
-            value = simulate_random(search_board)
+            value = simulate_random(search_board, rng=rng)
 
         # Adjust value to be from the perspective of the leaf node's parent
         # The simulation returns White's perspective. We need the parent's perspective.
@@ -473,6 +539,10 @@ def mcts_search(board: chess.Board, simulations: int = 200,
         # 4. BACKPROPAGATION - Update tree
         backpropagate(node, value)
 
+        if stop_event is not None and stop_event.is_set():
+            simulations = i + 1  # For the statistics below
+            break
+
     elapsed = time.time() - start_time
 
     if verbose:
@@ -502,7 +572,10 @@ def mcts_search(board: chess.Board, simulations: int = 200,
 def best_move_mcts(board: chess.Board, simulations: int = 200,
                    use_evaluator: bool = True, sample_size: int = 10,
                    filter_blunders: bool = True,
-                   verbose: bool = False) -> Optional[chess.Move]:
+                   verbose: bool = False,
+                   root: Optional[MCTSNode] = None,
+                   stop_event=None,
+                   rng: Optional[random.Random] = None) -> Optional[chess.Move]:
     """
     Wrapper function for MCTS search (matches interface of other engines).
 
@@ -513,13 +586,94 @@ def best_move_mcts(board: chess.Board, simulations: int = 200,
         sample_size: Number of moves to evaluate in rollouts (default: 10)
         filter_blunders: If True, filter moves that hang pieces (default: True)
         verbose: Print search statistics
+        root: Optional existing root node to keep searching from
+        stop_event: Optional threading.Event that ends the search early
+        rng: Optional random.Random used by the search
 
     Returns:
         Best move found
     """
     return mcts_search(board, simulations=simulations,
                       use_evaluator=use_evaluator, sample_size=sample_size,
-                      filter_blunders=filter_blunders, verbose=verbose)
+                      filter_blunders=filter_blunders, verbose=verbose, root=root,
+                      stop_event=stop_event, rng=rng)
+
+
+# Worker pool for best_move_mcts_parallel, kept alive between searches
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_workers = 0
+
+
+def _get_executor(workers: int) -> ProcessPoolExecutor:
+    """Return the shared worker pool, (re)creating it for a new worker count."""
+    global _executor, _executor_workers
+    if _executor is None or _executor_workers != workers:
+        if _executor is not None:
+            _executor.shutdown(wait=False)
+        # spawn: the UCI engine runs a log-flusher thread, which fork would copy mid-state
+        _executor = ProcessPoolExecutor(max_workers=workers,
+                                        mp_context=multiprocessing.get_context("spawn"))
+        _executor_workers = workers
+    return _executor
+
+
+def _mcts_worker(board: chess.Board, simulations: int, use_evaluator: bool,
+                 sample_size: int, filter_blunders: bool, seed: int) -> dict:
+    """Worker task: run one independent search, return root visit counts by UCI move."""
+    rng = random.Random(seed)
+    root = MCTSNode(board, filter_blunders=filter_blunders, rng=rng)
+    mcts_search(board, simulations=simulations, use_evaluator=use_evaluator,
+                sample_size=sample_size, filter_blunders=filter_blunders, root=root,
+                rng=rng)
+    return {move.uci(): child.visit_count for move, child in root.children.items()}
+
+
+def best_move_mcts_parallel(board: chess.Board, simulations: int = 200,
+                            use_evaluator: bool = True, sample_size: int = 10,
+                            filter_blunders: bool = True,
+                            workers: Optional[int] = None,
+                            rng: Optional[random.Random] = None) -> Optional[chess.Move]:
+    """
+    Root-parallel MCTS: independent searches in worker processes, merged by visits.
+
+    Each worker builds its own tree from the same position with a different
+    random seed and runs its share of the simulations. The root visit counts
+    are summed and the most visited move is played. Processes sidestep the
+    GIL, so the search scales with cores.
+
+    Args:
+        board: Current position
+        simulations: Total number of MCTS iterations, split across workers
+        use_evaluator: Use smart rollouts (True) or random (False)
+        sample_size: Number of moves to evaluate in rollouts (default: 10)
+        filter_blunders: If True, filter moves that hang pieces (default: True)
+        workers: Number of worker processes (default: os.cpu_count())
+        rng: Random number generator the worker seeds are drawn from
+             (default: the global random module)
+
+    Returns:
+        Best move found, or None if no legal moves
+    """
+    if board.is_game_over():
+        return None
+    if rng is None:
+        rng = random
+
+    workers = workers or os.cpu_count() or 1
+    sims_per_worker = max(simulations // workers, 1)
+    executor = _get_executor(workers)
+
+    futures = [executor.submit(_mcts_worker, board.copy(), sims_per_worker, use_evaluator,
+                               sample_size, filter_blunders, rng.getrandbits(32))
+               for _ in range(workers)]
+
+    visits = Counter()
+    for future in futures:
+        visits.update(future.result())
+
+    if not visits:
+        return None
+    return chess.Move.from_uci(visits.most_common(1)[0][0])
 
 
 if __name__ == "__main__":
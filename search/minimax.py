@@ -15,6 +15,7 @@ Key improvements:
 import chess
 import sys
 import os
+import time
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -22,6 +23,79 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from engine.evaluator import evaluate
 
 
+class SearchStopped(Exception):
+    """Raised inside the search when its deadline passes or a stop is requested."""
+
+
+# Transposition table entry flags: whether the stored value is exact or only
+# a bound (the search failed high / low against its alpha-beta window)
+TT_EXACT = 0
+TT_LOWER = 1
+TT_UPPER = 2
+
+# Upper bound on stored positions (across both generations, see TranspositionTable)
+TT_MAX_ENTRIES = 1_000_000
+
+
+class TranspositionTable:
+    """
+    Bounded transposition table: position key -> (depth, flag, value, best_move).
+
+    Entries live in two generations. Results are stored in the current one
+    with depth-preferred replacement (a shallower search never overwrites a
+    deeper result for the same position). When the current generation is
+    full it becomes the old generation and the previous old one is dropped,
+    so memory stays bounded without losing the most recent results. Probes
+    that hit the old generation move the entry back into the current one.
+    """
+
+    def __init__(self, max_entries: int = TT_MAX_ENTRIES):
+        self.generation_size = max(max_entries // 2, 1)
+        self._current = {}
+        self._old = {}
+
+    def __len__(self) -> int:
+        return len(self._current) + len(self._old)
+
+    def get(self, key):
+        """Return the entry for a position key, or None."""
+        entry = self._current.get(key)
+        if entry is None:
+            entry = self._old.pop(key, None)
+            if entry is not None:
+                self._put(key, entry)
+        return entry
+
+    def store(self, key, depth: int, flag: int, value: float, best_move) -> None:
+        """
+        Store a search result.
+
+        Args:
+            key: Position key from board._transposition_key()
+            depth: Remaining search depth the value was computed with
+            flag: TT_EXACT, TT_LOWER or TT_UPPER
+            value: Search score (centipawns, White's perspective)
+            best_move: Best move found in this position (or None)
+        """
+        entry = self._current.get(key)
+        if entry is not None and entry[0] > depth:
+            return
+        self._put(key, (depth, flag, value, best_move))
+
+    def clear(self) -> None:
+        """Drop all entries (e.g. when a new game starts)."""
+        self._current.clear()
+        self._old.clear()
+
+    def _put(self, key, entry) -> None:
+        """Insert into the current generation, rotating generations when it is full."""
+        current = self._current
+        if key not in current and len(current) >= self.generation_size:
+            self._old = current
+            self._current = current = {}
+        current[key] = entry
+
+
 def quiescence_search(board: chess.Board, alpha: float, beta: float,
                       maximizing: bool, nodes_searched: list = None,
                       max_depth: int = 10) -> float:
@@ -180,7 +254,8 @@ def order_moves(board: chess.Board, moves: list) -> list:
 
 
 def minimax(board: chess.Board, depth: int, alpha: float, beta: float,
-            maximizing: bool, nodes_searched: list = None) -> float:
+            maximizing: bool, nodes_searched: list = None, tt: TranspositionTable = None,
+            deadline: float = None, stop_event=None) -> float:
     """
     Minimax search with alpha-beta pruning.
 
@@ -195,6 +270,12 @@ def minimax(board: chess.Board, depth: int, alpha: float, beta: float,
         beta: Best score Black can guarantee (upper bound)
         maximizing: True if maximizing player (White), False for minimizing (Black)
         nodes_searched: Optional list to track nodes (for debugging)
+        tt: Optional transposition table shared across searches
+        deadline: Optional time.monotonic() value; the search raises
+                  SearchStopped once it is passed (moves pushed on the way
+                  down are not popped, so the caller must restore the board)
+        stop_event: Optional threading.Event; once set, the search raises
+                    SearchStopped the same way
 
     Returns:
         Best evaluation score from this position (in centipawns, White's perspective)
@@ -202,6 +283,29 @@ def minimax(board: chess.Board, depth: int, alpha: float, beta: float,
     if nodes_searched is not None:
         nodes_searched[0] += 1
 
+    if stop_event is not None and stop_event.is_set():
+        raise SearchStopped("stop requested")
+    if deadline is not None and time.monotonic() > deadline:
+        raise SearchStopped("search deadline reached")
+
+    # Transposition table probe: reuse results searched at least this deep
+    tt_move = None
+    if tt is not None and depth > 0:
+        key = board._transposition_key()
+        entry = tt.get(key)
+        if entry is not None:
+            entry_depth, flag, value, tt_move = entry
+            if entry_depth >= depth:
+                if flag == TT_EXACT:
+                    return value
+                if flag == TT_LOWER:
+                    alpha = max(alpha, value)
+                else:
+                    beta = min(beta, value)
+                if beta <= alpha:
+                    return value
+    alpha_orig, beta_orig = alpha, beta
+
     # Base case: game over
     if board.is_game_over():
         return evaluate(board)
@@ -217,44 +321,62 @@ def minimax(board: chess.Board, depth: int, alpha: float, beta: float,
     if not legal_moves:
         return evaluate(board)
 
-    # Order moves for better pruning
+    # Order moves for better pruning (the TT's best move from an earlier search first)
     ordered_moves = order_moves(board, legal_moves)
+    if tt_move is not None and tt_move in legal_moves:
+        ordered_moves.remove(tt_move)
+        ordered_moves.insert(0, tt_move)
 
+    best_move = None
     if maximizing:
         # White's turn: maximize score
-        max_eval = float('-inf')
+        best_eval = float('-inf')
         for move in ordered_moves:
             board.push(move)
-            eval_score = minimax(board, depth - 1, alpha, beta, False, nodes_searched)
+            eval_score = minimax(board, depth - 1, alpha, beta, False, nodes_searched, tt,
+                                 deadline, stop_event)
             board.pop()
 
-            max_eval = max(max_eval, eval_score)
+            if eval_score > best_eval:
+                best_eval = eval_score
+                best_move = move
             alpha = max(alpha, eval_score)
 
             # Beta cutoff: Black won't allow this branch
             if beta <= alpha:
                 break  # Prune remaining moves
-
-        return max_eval
     else:
         # Black's turn: minimize score
-        min_eval = float('inf')
+        best_eval = float('inf')
         for move in ordered_moves:
             board.push(move)
-            eval_score = minimax(board, depth - 1, alpha, beta, True, nodes_searched)
+            eval_score = minimax(board, depth - 1, alpha, beta, True, nodes_searched, tt,
+                                 deadline, stop_event)
             board.pop()
 
-            min_eval = min(min_eval, eval_score)
+            if eval_score < best_eval:
+                best_eval = eval_score
+                best_move = move
             beta = min(beta, eval_score)
 
             # Alpha cutoff: White won't allow this branch
             if beta <= alpha:
                 break  # Prune remaining moves
 
-        return min_eval
+    if tt is not None:
+        if best_eval <= alpha_orig:
+            flag = TT_UPPER
+        elif best_eval >= beta_orig:
+            flag = TT_LOWER
+        else:
+            flag = TT_EXACT
+        tt.store(key, depth, flag, best_eval, best_move)
+
+    return best_eval
 
 
-def best_move_minimax(board: chess.Board, depth: int = 3, verbose: bool = False) -> chess.Move:
+def best_move_minimax(board: chess.Board, depth: int = 3, verbose: bool = False,
+                      tt: TranspositionTable = None, nodes_searched: list = None) -> chess.Move:
     """
     Find the best move using minimax search with alpha-beta pruning.
 
@@ -269,27 +391,64 @@ def best_move_minimax(board: chess.Board, depth: int = 3, verbose: bool = False)
                depth=4: Strong play, slower
                depth=5+: Very strong but much slower
         verbose: If True, print search statistics
+        tt: Optional transposition table. Pass the same table to successive
+            calls to reuse earlier results; clear it when a new game starts.
+        nodes_searched: Optional one-element list; the node count is added to it
 
     Returns:
         Best move found by search
     """
+    return search_root(board, depth, verbose, tt, nodes_searched)[0]
+
+
+def search_root(board: chess.Board, depth: int = 3, verbose: bool = False,
+                tt: TranspositionTable = None, nodes_searched: list = None,
+                deadline: float = None, stop_event=None) -> tuple:
+    """
+    Search the root position and return the best move together with its score.
+
+    Same search as best_move_minimax(), for callers that also report the
+    score (e.g. UCI 'info' lines) and shouldn't re-evaluate the position.
+
+    Args:
+        board: Current chess position
+        depth: Search depth in plies (half-moves)
+        verbose: If True, print search statistics
+        tt: Optional transposition table (see best_move_minimax)
+        nodes_searched: Optional one-element list; the node count is added to it
+        deadline: Optional time.monotonic() value after which the search
+                  raises SearchStopped (see minimax)
+        stop_event: Optional threading.Event that aborts the search when set
+
+    Returns:
+        (best_move, score) with score in centipawns from White's perspective.
+        score is None when nothing was searched (no legal moves, or a single
+        forced move); best_move is None when there are no legal moves.
+    """
     legal_moves = list(board.legal_moves)
 
     if not legal_moves:
-        return None
+        return None, None
 
     # Single legal move? Play it instantly
     if len(legal_moves) == 1:
-        return legal_moves[0]
+        return legal_moves[0], None
 
     best_move = None
     best_score = float('-inf') if board.turn == chess.WHITE else float('inf')
     alpha = float('-inf')
     beta = float('inf')
-    nodes_searched = [0]
+    if nodes_searched is None:
+        nodes_searched = [0]
 
     # Order moves for better pruning at root
     ordered_moves = order_moves(board, legal_moves)
+    if tt is not None:
+        root_key = board._transposition_key()
+        entry = tt.get(root_key)
+        if entry is not None and entry[3] in legal_moves:
+            ordered_moves.remove(entry[3])
+            ordered_moves.insert(0, entry[3])
 
     if verbose:
         print(f"Searching {len(legal_moves)} moves at depth {depth}...")
@@ -299,13 +458,15 @@ def best_move_minimax(board: chess.Board, depth: int = 3, verbose: bool = False)
 
         # After making our move, opponent tries to minimize (if we're White) or maximize (if we're Black)
         if board.turn == chess.BLACK:  # We just played as White
-            score = minimax(board, depth - 1, alpha, beta, False, nodes_searched)
+            score = minimax(board, depth - 1, alpha, beta, False, nodes_searched, tt,
+                            deadline, stop_event)
             if score > best_score:
                 best_score = score
                 best_move = move
             alpha = max(alpha, score)
         else:  # We just played as Black
-            score = minimax(board, depth - 1, alpha, beta, True, nodes_searched)
+            score = minimax(board, depth - 1, alpha, beta, True, nodes_searched, tt,
+                            deadline, stop_event)
             if score < best_score:
                 best_score = score
                 best_move = move
@@ -316,11 +477,15 @@ def best_move_minimax(board: chess.Board, depth: int = 3, verbose: bool = False)
         if verbose:
             print(f"  {move}: {score/100:.2f} pawns")
 
+    # The root is searched with a full window, so its score is exact
+    if tt is not None and best_move is not None:
+        tt.store(root_key, depth, TT_EXACT, best_score, best_move)
+
     if verbose:
         print(f"\nBest move: {best_move} (score: {best_score/100:.2f} pawns)")
         print(f"Nodes searched: {nodes_searched[0]:,}")
 
-    return best_move
+    return best_move, best_score
 
 
 if __name__ == "__main__":
@@ -6,16 +6,19 @@ This test suite validates that the MCTS implementation correctly handles:
 2. Multi-ply tactical positions
 3. Mate-in-N detection
 4. Even-depth vs odd-depth evaluation consistency
+5. Subtree reuse between moves and root-parallel search
 """
 
 import sys
 import os
+import random
 import chess
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from search.mcts import best_move_mcts, mcts_search, MCTSNode
+from search.mcts import (best_move_mcts, best_move_mcts_parallel, mcts_search,
+                         subtree_for, MCTSNode)
 
 
 def test_value_propagation_depth_2():
@@ -280,6 +283,96 @@ def test_perspective_alternation():
     return True
 
 
+def test_subtree_reuse():
+    """
+    Test that subtree_for() continues from the node for the moves played.
+
+    After a search, playing a move and a reply that are both in the tree
+    must give back that grandchild (with its statistics) as the new root.
+    """
+    print("\n" + "="*70)
+    print("TEST 6: Subtree Reuse")
+    print("="*70)
+
+    board = chess.Board()
+    root = MCTSNode(board, rng=random.Random(0))
+    mcts_search(board, simulations=100, use_evaluator=False, root=root,
+                rng=random.Random(0))
+
+    child = root.most_visited_child()
+    grandchild = child.most_visited_child()
+    assert grandchild is not None, "Search too small to reach depth 2"
+
+    played = board.copy()
+    played.push(child.move)
+    played.push(grandchild.move)
+    visits = grandchild.visit_count
+
+    node = subtree_for(root, played)
+    print(f"Played {child.move} {grandchild.move}: reused node with {node.visit_count} visits")
+    assert node is grandchild, "Did not reuse the node for the played moves"
+    assert node.parent is None, "Reused root is still attached to the old tree"
+    assert node.visit_count == visits, "Reused root lost its statistics"
+
+    # The same position again is the root itself
+    assert subtree_for(node, played) is node
+    print("✅ PASS: Subtree for the played moves is reused")
+
+
+def test_subtree_fresh_root():
+    """Test that subtree_for() starts a fresh root when the position isn't in the tree."""
+    print("\n" + "="*70)
+    print("TEST 7: Fresh Root for Unknown Positions")
+    print("="*70)
+
+    board = chess.Board()
+    root = MCTSNode(board, rng=random.Random(0))
+    mcts_search(board, simulations=50, use_evaluator=False, root=root,
+                rng=random.Random(0))
+    child = root.most_visited_child()
+    move = child.move
+
+    # Same move, different start position (same move stack, different board)
+    other = chess.Board("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBN1 w Qkq - 0 1")
+    other.push(move)
+    # A reply the search never tried: the position isn't in the tree
+    diverged = board.copy()
+    diverged.push(move)
+    diverged.push(next(m for m in diverged.legal_moves if m not in child.children))
+    # Takeback: the new position is shorter than the old root's
+    played = board.copy()
+    played.push(move)
+    reused = subtree_for(root, played)
+
+    cases = [("no previous tree", None, board),
+             ("different start position", root, other),
+             ("untried reply", root, diverged),
+             ("takeback", reused, board)]
+    for name, old_root, position in cases:
+        node = subtree_for(old_root, position)
+        print(f"{name}: {node.visit_count} visits")
+        assert node is not old_root and node.visit_count == 0, f"Reused a node for {name}"
+        assert node.parent is None
+        assert node.board.fen() == position.fen(), f"Fresh root has the wrong position for {name}"
+    print("✅ PASS: Positions outside the tree get a fresh root")
+
+
+def test_parallel_search():
+    """Test root-parallel MCTS in worker processes: legal and reproducible with a seeded rng."""
+    print("\n" + "="*70)
+    print("TEST 8: Root-Parallel Search")
+    print("="*70)
+
+    board = chess.Board("6k1/5ppp/8/8/8/8/5PPP/4R1K1 w - - 0 1")
+    moves = [best_move_mcts_parallel(board, simulations=100, use_evaluator=False,
+                                     workers=2, rng=random.Random(1))
+             for _ in range(2)]
+    print(f"Moves: {moves}")
+    assert moves[0] in board.legal_moves
+    assert moves[0] == moves[1], "Same seed gave different moves"
+    print("✅ PASS: Parallel search returns a legal, reproducible move")
+
+
 def run_all_tests():
     """Run all MCTS correctness tests."""
     print("\n" + "="*70)
@@ -295,12 +388,16 @@ def run_all_tests():
         ("Avoid Blunder", test_avoid_blunder),
         ("Node Value Consistency", test_node_value_consistency),
         ("Perspective Alternation", test_perspective_alternation),
+        ("Subtree Reuse", test_subtree_reuse),
+        ("Fresh Root for Unknown Positions", test_subtree_fresh_root),
+        ("Root-Parallel Search", test_parallel_search),
     ]
 
     results = []
     for name, test_func in tests:
         try:
-            passed = test_func()
+            # Older tests return True/False; newer ones assert and return None
+            passed = test_func() is not False
             results.append((name, passed))
         except Exception as e:
             print(f"\n❌ ERROR in {name}: {e}")
@@ -0,0 +1,103 @@
+"""
+Test the minimax transposition table.
+
+Checks that:
+1. Searching with a transposition table finds the same move and score as
+   the plain search
+2. The table stays within its entry bound, keeping the newest results
+"""
+
+import sys
+import os
+import chess
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from search.minimax import search_root, TranspositionTable, TT_EXACT, TT_LOWER
+
+
+# Fixed positions searched with and without a table
+TT_POSITIONS = [
+    chess.STARTING_FEN,
+    # Scholar's mate available: Qxf7#
+    "r1bqkb1r/pppp1ppp/2n2n2/4p2Q/2B1P3/8/PPPP1PPP/RNB1K1NR w KQkq - 4 4",
+    # Back-rank mate: Re8#
+    "6k1/5ppp/8/8/8/8/5PPP/4R1K1 w - - 0 1",
+    # King and pawn ending
+    "8/8/4k3/8/2K5/8/3P4/8 w - - 0 1",
+    # Middlegame with captures on d5
+    "r3k2r/ppp2ppp/2n1bn2/2bpp3/4P3/2NP1N2/PPPBBPPP/R2QK2R w KQkq - 0 8",
+]
+
+
+def test_tt_search_matches_plain_search():
+    """A search with a fresh table returns the plain search's move and score."""
+    for fen in TT_POSITIONS:
+        board = chess.Board(fen)
+        plain = search_root(board, 3)
+        with_tt = search_root(board, 3, tt=TranspositionTable())
+        print(f"{fen}: plain {plain}, with TT {with_tt}")
+        assert with_tt == plain, f"TT search differs on {fen}: {with_tt} vs {plain}"
+        assert board.fen() == fen, "Search left moves on the board"
+
+
+def test_tt_reused_across_depths_keeps_score():
+    """Filling the table at depths 1-2 first (iterative deepening) doesn't change the score."""
+    for fen in TT_POSITIONS:
+        board = chess.Board(fen)
+        _, plain_score = search_root(board, 3)
+        tt = TranspositionTable()
+        for depth in (1, 2):
+            search_root(board, depth, tt=tt)
+        move, score = search_root(board, 3, tt=tt)
+        assert score == plain_score, f"Deepened TT score {score} != {plain_score} on {fen}"
+        assert move in board.legal_moves
+
+
+def test_tt_generations_bound_entries():
+    """The table never holds more than max_entries and keeps the newest entries."""
+    tt = TranspositionTable(max_entries=8)  # Two generations of 4
+    for key in range(100):
+        tt.store(key, 1, TT_EXACT, key, None)
+        assert len(tt) <= 8, f"{len(tt)} entries after storing {key + 1}"
+
+    # The last two generations survive, everything older is gone (checked on
+    # the generations directly: a probe would move entries between them)
+    kept = set(tt._current) | set(tt._old)
+    assert kept == set(range(92, 100)), f"Kept keys {sorted(kept)}"
+
+
+def test_tt_probe_refreshes_old_entry():
+    """An entry found in the old generation survives the next rotation."""
+    tt = TranspositionTable(max_entries=4)  # Two generations of 2
+    tt.store("a", 1, TT_EXACT, 0, None)
+    tt.store("b", 1, TT_EXACT, 0, None)
+    tt.store("c", 1, TT_EXACT, 0, None)  # Rotates: "a", "b" are now old
+
+    assert tt.get("a") is not None  # Moved back into the current generation
+    tt.store("d", 1, TT_EXACT, 0, None)  # Rotates again: "b" is dropped
+
+    assert tt.get("a") is not None
+    assert tt.get("b") is None
+    assert len(tt) <= 4
+
+
+def test_tt_depth_preferred_replacement():
+    """A shallower result doesn't overwrite a deeper one for the same position."""
+    tt = TranspositionTable()
+    tt.store("pos", 3, TT_EXACT, 50, None)
+    tt.store("pos", 1, TT_LOWER, -20, None)
+    assert tt.get("pos") == (3, TT_EXACT, 50, None)
+
+    tt.store("pos", 4, TT_LOWER, 10, None)
+    assert tt.get("pos") == (4, TT_LOWER, 10, None)
+
+
+if __name__ == "__main__":
+    test_tt_search_matches_plain_search()
+    test_tt_reused_across_depths_keeps_score()
+    test_tt_generations_bound_entries()
+    test_tt_probe_refreshes_old_entry()
+    test_tt_depth_preferred_replacement()
+    print("\n✅ All transposition table tests passed!")
@@ -10,10 +10,13 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import chess
+import collections
+import functools
 import random
 import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from search.minimax import best_move_minimax
-from engine.evaluator import best_move_material
+from engine.evaluator import best_move_material, evaluate_material
 
 
 def random_move(board: chess.Board) -> chess.Move:
@@ -21,7 +24,8 @@ def random_move(board: chess.Board) -> chess.Move:
     return random.choice(list(board.legal_moves))
 
 
-def play_game(white_player, black_player, max_moves=200, verbose=False):
+def play_game(white_player, black_player, max_moves=200, verbose=False, board=None,
+              resign_threshold=15, resign_plies=10):
     """
     Play a single game between two players.
 
@@ -30,14 +34,24 @@ def play_game(white_player, black_player, max_moves=200, verbose=False):
         black_player: Function that takes board and returns move
         max_moves: Maximum number of moves before declaring draw
         verbose: Print game progress
+        board: Optional board to reuse (reset to the starting position)
+        resign_threshold: Material lead (in pawns) at which the losing side resigns,
+                          or None to always play on
+        resign_plies: Number of consecutive plies the lead must hold before resigning
 
     Returns:
         result: "1-0" (white wins), "0-1" (black wins), "1/2-1/2" (draw)
         moves: Number of moves played
         reason: Why the game ended
     """
-    board = chess.Board()
+    if board is None:
+        board = chess.Board()
+    else:
+        board.reset()
     moves = 0
+    resigned = False
+    lead_streak = 0  # Consecutive plies with a decisive material lead
+    lead_sign = 0    # +1 White ahead, -1 Black ahead
 
     if verbose:
         print("\nStarting new game...")
@@ -64,6 +78,20 @@ def play_game(white_player, black_player, max_moves=200, verbose=False):
         if verbose and moves % 10 == 0:
             print(f"Move {moves}...")
 
+        # Adjudicate clearly decided games instead of playing them out
+        if resign_threshold is not None:
+            balance = evaluate_material(board)
+            if abs(balance) >= resign_threshold * 100:
+                sign = 1 if balance > 0 else -1
+                lead_streak = lead_streak + 1 if sign == lead_sign else 1
+                lead_sign = sign
+                if lead_streak >= resign_plies:
+                    resigned = True
+                    break
+            else:
+                lead_streak = 0
+                lead_sign = 0
+
     # Game over - check result
     if board.is_checkmate():
         result = "0-1" if board.turn == chess.WHITE else "1-0"
@@ -74,6 +102,9 @@ def play_game(white_player, black_player, max_moves=200, verbose=False):
     elif board.is_insufficient_material():
         result = "1/2-1/2"
         reason = "insufficient material"
+    elif resigned:
+        result = "1-0" if lead_sign > 0 else "0-1"
+        reason = "resignation"
     elif board.can_claim_fifty_moves():
         result = "1/2-1/2"
         reason = "fifty-move rule"
@@ -93,7 +124,31 @@ def play_game(white_player, black_player, max_moves=200, verbose=False):
     return result, moves, reason
 
 
-def run_tournament(player1, player1_name, player2, player2_name, num_games=20, verbose=False):
+def assign_colors(game_num, player1, player1_name, player2, player2_name):
+    """Alternate colors: player1 is White in even-numbered games."""
+    if game_num % 2 == 0:
+        return player1, player1_name, player2, player2_name
+    return player2, player2_name, player1, player1_name
+
+
+def play_tournament_game(game_num, player1, player1_name, player2, player2_name,
+                         verbose=False, board=None):
+    """
+    Play one tournament game with colors assigned by game number.
+
+    Module-level (rather than nested in run_tournament) so it can be
+    submitted to a process pool.
+
+    Returns:
+        (white_is_player1, result, moves, reason)
+    """
+    white, _, black, _ = assign_colors(game_num, player1, player1_name, player2, player2_name)
+    result, moves, reason = play_game(white, black, verbose=verbose, board=board)
+    return game_num % 2 == 0, result, moves, reason
+
+
+def run_tournament(player1, player1_name, player2, player2_name, num_games=20, verbose=False,
+                   workers=1):
     """
     Run a tournament between two players.
 
@@ -104,6 +159,8 @@ def run_tournament(player1, player1_name, player2, player2_name, num_games=20, v
         player2_name: Name for reporting
         num_games: Number of games to play (each player gets num_games/2 as white)
         verbose: Print detailed game info
+        workers: Number of processes to play games in parallel (1 = sequential).
+                 Players must be picklable (module-level functions).
 
     Returns:
         Dictionary with tournament results
@@ -112,63 +169,74 @@ def run_tournament(player1, player1_name, player2, player2_name, num_games=20, v
     print(f"TOURNAMENT: {player1_name} vs {player2_name}")
     print(f"{'='*60}")
     print(f"Games: {num_games} ({num_games//2} as White, {num_games//2} as Black for each)")
+    if workers > 1:
+        print(f"Workers: {workers}")
 
     results = {
         "player1_wins": 0,
         "player2_wins": 0,
         "draws": 0,
         "total_moves": 0,
-        "reasons": {},
+        "reasons": collections.Counter(),
         "games": []
     }
 
     start_time = time.time()
+    completed = 0
 
-    for game_num in range(num_games):
-        # Alternate colors
-        if game_num % 2 == 0:
-            white, black = player1, player2
-            white_name, black_name = player1_name, player2_name
-        else:
-            white, black = player2, player1
-            white_name, black_name = player2_name, player1_name
-
-        if verbose or (game_num + 1) % 5 == 0:
-            print(f"\nGame {game_num + 1}/{num_games}: {white_name} (W) vs {black_name} (B)")
-
-        result, moves, reason = play_game(white, black, verbose=verbose)
+    def record_game(white_is_player1, result, moves, reason):
+        """Fold one finished game into the results and report progress."""
+        nonlocal completed
+        completed += 1
 
         results["total_moves"] += moves
         results["games"].append({
-            "white": white_name,
-            "black": black_name,
+            "white": player1_name if white_is_player1 else player2_name,
+            "black": player2_name if white_is_player1 else player1_name,
             "result": result,
             "moves": moves,
             "reason": reason
         })
 
         # Update reason statistics
-        results["reasons"][reason] = results["reasons"].get(reason, 0) + 1
+        results["reasons"][reason] += 1
 
-        # Update win/loss/draw
-        if result == "1-0":
-            if white_name == player1_name:
-                results["player1_wins"] += 1
-            else:
-                results["player2_wins"] += 1
-        elif result == "0-1":
-            if black_name == player1_name:
-                results["player1_wins"] += 1
-            else:
-                results["player2_wins"] += 1
-        else:  # Draw
+        # Update win/loss/draw: player1 won if the winning color is the one it played
+        if result == "1/2-1/2":
             results["draws"] += 1
+        elif (result == "1-0") == white_is_player1:
+            results["player1_wins"] += 1
+        else:
+            results["player2_wins"] += 1
 
         # Print progress
-        if not verbose and (game_num + 1) % 5 == 0:
+        if not verbose and completed % 5 == 0:
             p1_score = results["player1_wins"] + results["draws"] * 0.5
             p2_score = results["player2_wins"] + results["draws"] * 0.5
-            print(f"  Progress: {player1_name} {p1_score:.1f} - {player2_name} {p2_score:.1f} ({results['draws']} draws)")
+            print(f"  Progress ({completed}/{num_games}): {player1_name} {p1_score:.1f} - "
+                  f"{player2_name} {p2_score:.1f} ({results['draws']} draws)")
+
+    if workers > 1:
+        # Games finish out of order; report each one as soon as it is done
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(play_tournament_game, game_num,
+                                player1, player1_name, player2, player2_name, verbose)
+                for game_num in range(num_games)
+            ]
+            for future in as_completed(futures):
+                record_game(*future.result())
+    else:
+        board = chess.Board()  # Reused (reset) for every game
+
+        for game_num in range(num_games):
+            if verbose or (game_num + 1) % 5 == 0:
+                _, white_name, _, black_name = assign_colors(
+                    game_num, player1, player1_name, player2, player2_name)
+                print(f"\nGame {game_num + 1}/{num_games}: {white_name} (W) vs {black_name} (B)")
+
+            record_game(*play_tournament_game(game_num, player1, player1_name,
+                                              player2, player2_name, verbose, board))
 
     elapsed = time.time() - start_time
 
@@ -200,7 +268,7 @@ def run_tournament(player1, player1_name, player2, player2_name, num_games=20, v
     print(f"Total time: {elapsed:.1f}s ({elapsed/num_games:.1f}s per game)")
 
     print(f"\nGame endings:")
-    for reason, count in sorted(results["reasons"].items(), key=lambda x: -x[1]):
+    for reason, count in results["reasons"].most_common():
         print(f"  {reason}: {count}")
 
     # Strength interpretation
@@ -226,16 +294,45 @@ def run_tournament(player1, player1_name, player2, player2_name, num_games=20, v
     return results
 
 
+def memoize_player(player):
+    """
+    Cache a deterministic player's moves by position.
+
+    Games in a tournament keep revisiting the same opening positions, so
+    the move for each position is computed once and then served from a
+    dict keyed on the board's Zobrist-based transposition key.
+
+    Only wrap players that always return the same move for the same
+    position (e.g. minimax) - not random_move or best_move_material,
+    which break ties randomly.
+    """
+    cache = {}
+
+    @functools.wraps(player)
+    def wrapper(board):
+        key = board._transposition_key()
+        move = cache.get(key)
+        if move is None:
+            move = player(board)
+            cache[key] = move
+        return move
+
+    return wrapper
+
+
+@memoize_player
 def minimax_depth_2(board):
     """Minimax with depth 2."""
     return best_move_minimax(board, depth=2, verbose=False)
 
 
+@memoize_player
 def minimax_depth_3(board):
     """Minimax with depth 3 (current engine)."""
     return best_move_minimax(board, depth=3, verbose=False)
 
 
+@memoize_player
 def minimax_depth_4(board):
     """Minimax with depth 4 (stronger)."""
     return best_move_minimax(board, depth=4, verbose=False)
@@ -248,6 +345,8 @@ if __name__ == "__main__":
     parser.add_argument("--games", type=int, default=20, help="Number of games to play")
     parser.add_argument("--quick", action="store_true", help="Quick test (10 games)")
     parser.add_argument("--verbose", action="store_true", help="Verbose output")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Play games in parallel across this many processes")
 
     args = parser.parse_args()
 
@@ -262,7 +361,8 @@ if __name__ == "__main__":
         minimax_depth_3, "Minimax Depth 3 (Current)",
         random_move, "Random Player",
         num_games=num_games,
-        verbose=args.verbose
+        verbose=args.verbose,
+        workers=args.workers
     )
 
     # Tournament 2: Current engine (depth 3) vs Material-only
@@ -270,7 +370,8 @@ if __name__ == "__main__":
         minimax_depth_3, "Minimax Depth 3 (Current)",
         best_move_material, "Material-Only",
         num_games=num_games,
-        verbose=args.verbose
+        verbose=args.verbose,
+        workers=args.workers
     )
 
     # Tournament 3: Current engine (depth 3) vs Depth 2
@@ -278,7 +379,8 @@ if __name__ == "__main__":
         minimax_depth_3, "Minimax Depth 3 (Current)",
         minimax_depth_2, "Minimax Depth 2",
         num_games=num_games,
-        verbose=args.verbose
+        verbose=args.verbose,
+        workers=args.workers
     )
 
     # Tournament 4: Depth 3 vs Depth 4 (to see how much stronger depth 4 is)
@@ -287,7 +389,8 @@ if __name__ == "__main__":
         minimax_depth_3, "Minimax Depth 3 (Current)",
         minimax_depth_4, "Minimax Depth 4",
         num_games=num_games//2 if num_games > 10 else 6,  # Fewer games for slow depth-4
-        verbose=args.verbose
+        verbose=args.verbose,
+        workers=args.workers
     )
 
     print(f"\n{'='*60}")
@@ -6,7 +6,24 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import chess
 
-def verify_mate(name, fen, expected_move):
+# Mate puzzles to verify: (name, FEN, expected move parsed once)
+PUZZLES = [
+    # My new "Queen and Bishop Mate" puzzle
+    ("Queen and Bishop Mate",
+     "r1b1kb1r/pppp1ppp/2n2q2/4n3/2B1P3/2N2N2/PPPP1PPP/R1BQ1RK1 w kq - 0 1",
+     chess.Move.from_uci("d1d8")),
+    # "Queen Mate on f7 (Scholar's Mate)" - I modified this one
+    ("Queen Mate on f7 (Scholar's Mate)",
+     "r1bqkbnr/pppp1ppp/2n5/4p2Q/2B1P3/8/PPPP1PPP/RNB1K1NR w KQkq - 0 1",
+     chess.Move.from_uci("h5f7")),
+    # "Legal's Mate Pattern" - I created this
+    ("Legal's Mate Pattern (should be mate in 2, not 1)",
+     "r1bqk2r/pppp1ppp/2n2n2/2b1p3/2B1P3/3P1N2/PPP2PPP/RNBQ1RK1 b kq - 0 1",
+     chess.Move.from_uci("c6d4")),
+]
+
+
+def verify_mate(name, fen, expected_move: chess.Move):
     """Verify a move is actually checkmate."""
     print(f"\n{'='*70}")
     print(f"Verifying: {name}")
@@ -19,14 +36,13 @@ def verify_mate(name, fen, expected_move):
     print(f"Side to move: {'White' if board.turn else 'Black'}")
 
     # Check if move is legal
-    move = chess.Move.from_uci(expected_move)
-    if move not in board.legal_moves:
+    if expected_move not in board.legal_moves:
         print(f"\n❌ ERROR: {expected_move} is NOT a legal move!")
         print(f"Legal moves: {[str(m) for m in board.legal_moves][:10]}")
         return False
 
     # Make the move
-    board.push(move)
+    board.push(expected_move)
     print(f"\nAfter {expected_move}:")
     print(board)
     print(f"\nIs checkmate: {board.is_checkmate()}")
@@ -43,30 +59,12 @@ def verify_mate(name, fen, expected_move):
             print(f"Legal moves: {[str(m) for m in board.legal_moves]}")
         return False
 
-# Verify my new "Queen and Bishop Mate" puzzle
 print("="*70)
 print("VERIFYING NEW PUZZLES I CREATED")
 print("="*70)
 
-verify_mate(
-    "Queen and Bishop Mate",
-    "r1b1kb1r/pppp1ppp/2n2q2/4n3/2B1P3/2N2N2/PPPP1PPP/R1BQ1RK1 w kq - 0 1",
-    "d1d8"
-)
-
-# Verify "Queen Mate on f7 (Scholar's Mate)" - I modified this one
-verify_mate(
-    "Queen Mate on f7 (Scholar's Mate)",
-    "r1bqkbnr/pppp1ppp/2n5/4p2Q/2B1P3/8/PPPP1PPP/RNB1K1NR w KQkq - 0 1",
-    "h5f7"
-)
-
-# Verify "Legal's Mate Pattern" - I created this
-verify_mate(
-    "Legal's Mate Pattern (should be mate in 2, not 1)",
-    "r1bqk2r/pppp1ppp/2n2n2/2b1p3/2B1P3/3P1N2/PPP2PPP/RNBQ1RK1 b kq - 0 1",
-    "c6d4"
-)
+for name, fen, expected_move in PUZZLES:
+    verify_mate(name, fen, expected_move)
 
 print("\n" + "="*70)
 print("CHECKING HANGING PIECES PUZZLES")
@@ -78,7 +76,7 @@ print("\nHanging Queen (pawn) puzzle:")
 print(board)
 print(f"\nIs e4 pawn defended? Let's check if Nxe4 is a good move:")
 move = chess.Move.from_uci("f6e4")
-board_after = board.copy()
+board_after = board.copy(stack=False)
 board_after.push(move)
 print(f"After Nxe4: Material balance likely favors Black (captured pawn)")
 print("✅ This puzzle is correct - Black should capture the pawn")
@@ -5,6 +5,33 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import chess
+from itertools import islice
+
+# Puzzles under review: name -> (FEN, expected moves, description).
+# Expected moves are parsed into chess.Move objects once, here.
+PUZZLES = {
+    "Fool's Mate Pattern": (
+        "rnb1kbnr/pppp1ppp/8/4p3/6Pq/5P2/PPPPP2P/RNBQKBNR w KQkq - 0 1",
+        [chess.Move.from_uci(m) for m in ["d1h5"]],
+        "Back rank weakness - queen delivers mate"
+    ),
+    "Queen Mate on f7": (
+        "r1bqkb1r/pppp1Qpp/2n2n2/4p3/2B1P3/8/PPPP1PPP/RNB1K1NR b KQkq - 0 1",
+        [chess.Move.from_uci(m) for m in ["e8f7"]],
+        "Black king must take queen on f7, then Bxf7# is checkmate (This is BLACK to move - king takes queen)"
+    ),
+    "Hanging Queen": (
+        "rnbqkbnr/pppp1ppp/8/4p3/4P3/8/PPPPQPPP/RNB1KBNR b KQkq - 0 1",
+        [chess.Move.from_uci(m) for m in ["d8e7", "d8h4", "d8f6", "f8c5", "g8f6", "b8c6"]],
+        "White queen on e2 is undefended (but may not be capturable immediately)"
+    ),
+    "Hanging Rook": (
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
+        [chess.Move.from_uci(m) for m in ["e2e4", "d2d4", "g1f3"]],
+        "Starting position - no hanging pieces, develop normally"
+    ),
+}
+
 
 def analyze_position(name, fen, expected_moves, description):
     """Analyze a single position."""
@@ -13,7 +40,7 @@ def analyze_position(name, fen, expected_moves, description):
     print(f"{'='*70}")
     print(f"Description: {description}")
     print(f"FEN: {fen}")
-    print(f"Expected moves: {expected_moves}")
+    print(f"Expected moves: {[move.uci() for move in expected_moves]}")
     print()
 
     board = chess.Board(fen)
@@ -25,25 +52,25 @@ def analyze_position(name, fen, expected_moves, description):
     print(f"Is checkmate: {board.is_checkmate()}")
     print()
 
-    # Check if expected moves are legal
-    legal_moves = [str(m) for m in board.legal_moves]
-    print(f"Legal moves ({len(legal_moves)}):")
-    for i, move in enumerate(legal_moves[:20], 1):  # Show first 20
+    # Check if expected moves are legal (set gives O(1) membership tests)
+    legal_set = set(board.legal_moves)
+    print(f"Legal moves ({len(legal_set)}):")
+    for i, move in enumerate(islice(board.legal_moves, 20), 1):  # Show first 20
         print(f"  {move}", end="  ")
         if i % 5 == 0:
             print()
-    if len(legal_moves) > 20:
-        print(f"\n  ... and {len(legal_moves) - 20} more")
+    if len(legal_set) > 20:
+        print(f"\n  ... and {len(legal_set) - 20} more")
     else:
         print()
 
     print()
     for expected in expected_moves:
-        if expected in legal_moves:
+        if expected in legal_set:
             print(f"✅ Expected move '{expected}' is legal")
             # Try the move and see what happens
-            test_board = board.copy()
-            test_board.push(chess.Move.from_uci(expected))
+            test_board = board.copy(stack=False)
+            test_board.push(expected)
             print(f"   After {expected}:")
             print(f"   - Check: {test_board.is_check()}")
             print(f"   - Checkmate: {test_board.is_checkmate()}")
@@ -51,7 +78,7 @@ def analyze_position(name, fen, expected_moves, description):
         else:
             print(f"❌ Expected move '{expected}' is NOT legal!")
 
-    return board, legal_moves
+    return board, legal_set
 
 
 # Problem 1: Fool's Mate Pattern
@@ -59,12 +86,7 @@ print("\n" + "="*70)
 print("PROBLEM 1: Fool's Mate Pattern")
 print("="*70)
 
-analyze_position(
-    "Fool's Mate Pattern",
-    "rnb1kbnr/pppp1ppp/8/4p3/6Pq/5P2/PPPPP2P/RNBQKBNR w KQkq - 0 1",
-    ["d1h5"],
-    "Back rank weakness - queen delivers mate"
-)
+analyze_position("Fool's Mate Pattern", *PUZZLES["Fool's Mate Pattern"])
 
 # Check what the position actually looks like
 print("\nANALYSIS:")
@@ -77,12 +99,7 @@ print("\n\n" + "="*70)
 print("PROBLEM 2: Queen Mate on f7")
 print("="*70)
 
-analyze_position(
-    "Queen Mate on f7",
-    "r1bqkb1r/pppp1Qpp/2n2n2/4p3/2B1P3/8/PPPP1PPP/RNB1K1NR b KQkq - 0 1",
-    ["e8f7"],
-    "Black king must take queen on f7, then Bxf7# is checkmate (This is BLACK to move - king takes queen)"
-)
+analyze_position("Queen Mate on f7", *PUZZLES["Queen Mate on f7"])
 
 print("\nANALYSIS:")
 print("White has a queen on f7, Black king on e8.")
@@ -97,23 +114,18 @@ print("\n\n" + "="*70)
 print("PROBLEM 3: Hanging Queen")
 print("="*70)
 
-analyze_position(
-    "Hanging Queen",
-    "rnbqkbnr/pppp1ppp/8/4p3/4P3/8/PPPPQPPP/RNB1KBNR b KQkq - 0 1",
-    ["d8e7", "d8h4", "d8f6", "f8c5", "g8f6", "b8c6"],
-    "White queen on e2 is undefended (but may not be capturable immediately)"
-)
+analyze_position("Hanging Queen", *PUZZLES["Hanging Queen"])
 
 print("\nANALYSIS:")
 print("White's queen is on e2. Let's check if Black can capture it:")
-for move_str in ["d8e7", "d8h4", "d8f6"]:
-    board = chess.Board("rnbqkbnr/pppp1ppp/8/4p3/4P3/8/PPPPQPPP/RNB1KBNR b KQkq - 0 1")
-    move = chess.Move.from_uci(move_str)
+hanging_queen_fen, hanging_queen_moves, _ = PUZZLES["Hanging Queen"]
+for move in hanging_queen_moves[:3]:  # The queen moves: d8e7, d8h4, d8f6
+    board = chess.Board(hanging_queen_fen)
     board.push(move)
     # Check if queen is hanging
-    print(f"After {move_str}: Can White queen on e2 be captured? ", end="")
-    # The queen is still on e2
-    if chess.QUEEN in [board.piece_at(chess.E2).piece_type if board.piece_at(chess.E2) else None]:
+    print(f"After {move}: Can White queen on e2 be captured? ", end="")
+    # The queen is still on e2 (single bitboard test instead of two piece_at lookups)
+    if board.queens & chess.BB_E2:
         print("Queen still on e2 - not captured!")
     else:
         print("Queen captured or moved")
@@ -126,12 +138,7 @@ print("\n\n" + "="*70)
 print("PROBLEM 4: Hanging Rook (Starting Position)")
 print("="*70)
 
-analyze_position(
-    "Hanging Rook",
-    "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
-    ["e2e4", "d2d4", "g1f3"],
-    "Starting position - no hanging pieces, develop normally"
-)
+analyze_position("Hanging Rook", *PUZZLES["Hanging Rook"])
 
 print("\nANALYSIS:")
 print("This is just the starting position. No hanging pieces at all.")
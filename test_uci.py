@@ -4,8 +4,111 @@ Quick test script for Chess_RL UCI engine.
 Shows that the UCI engine is working properly.
 """
 
+import asyncio
+import atexit
+import os
+import queue
+import random
 import subprocess
 import sys
+import tempfile
+import threading
+import time
+
+import chess
+
+from uci.engine import UCIEngine, MOVE_OVERHEAD_MS
+
+# Commands sent to every engine configuration
+COMMANDS = [
+    "uci",
+    "isready",
+    "ucinewgame",
+    "position startpos",
+    "go depth 3",
+    "position startpos moves e2e4",
+    "go depth 2",
+    "quit"
+]
+
+# Engine configurations to test: name -> setoption commands sent after "uci"
+ENGINE_CONFIGS = {
+    "minimax": ["setoption name Engine Type value minimax"],
+    "material": ["setoption name Engine Type value material"],
+}
+
+
+async def run_engine(options, timeout=30):
+    """
+    Run one engine subprocess with the given options and return its stdout.
+
+    'quit' ends a search that is still running, so it is only sent once every
+    'go' has answered with bestmove.
+
+    Raises:
+        asyncio.TimeoutError: If the engine doesn't finish within timeout seconds
+    """
+    commands = COMMANDS[:1] + options + COMMANDS[1:-1]
+    searches = sum(1 for cmd in commands if cmd.startswith("go"))
+
+    proc = await asyncio.create_subprocess_exec(
+        sys.executable, "chess_rl_uci.py",
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+
+    async def converse():
+        proc.stdin.write(("\n".join(commands) + "\n").encode())
+        await proc.stdin.drain()
+        output = []
+        remaining = searches
+        while remaining:
+            line = await proc.stdout.readline()
+            if not line:
+                break  # Engine exited early
+            output.append(line.decode())
+            if line.startswith(b"bestmove"):
+                remaining -= 1
+        stdout, stderr = await proc.communicate(f"{COMMANDS[-1]}\n".encode())
+        return "".join(output) + stdout.decode(), stderr.decode()
+
+    try:
+        return await asyncio.wait_for(converse(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise
+
+
+async def run_all_engines():
+    """Run every engine configuration concurrently."""
+    outputs = await asyncio.gather(
+        *(run_engine(options) for options in ENGINE_CONFIGS.values()),
+        return_exceptions=True
+    )
+    return dict(zip(ENGINE_CONFIGS, outputs))
+
+
+def validate_output(name, output):
+    """Print validation checks for one engine's output; return True if all passed."""
+    checks = [
+        ("uciok" in output, "✓ UCI identification works"),
+        ("readyok" in output, "✓ Ready check works"),
+        ("bestmove" in output, "✓ Move generation works"),
+    ]
+    if name == "minimax":
+        checks.append(("e2e4" in output or "d2d4" in output or "g1f3" in output,
+                       "✓ Engine makes reasonable moves (e4, d4, or Nf3)"))
+
+    all_passed = True
+    for passed, message in checks:
+        status = "✅" if passed else "❌"
+        print(f"{status} {message}")
+        if not passed:
+            all_passed = False
+    return all_passed
+
 
 def test_uci_engine():
     """Test the UCI engine with basic commands."""
@@ -15,93 +118,360 @@ def test_uci_engine():
     print("=" * 60)
     print()
 
-    # Commands to send to the engine
-    commands = [
-        "uci",
-        "isready",
-        "ucinewgame",
-        "position startpos",
-        "go depth 3",
-        "position startpos moves e2e4",
-        "go depth 2",
-        "quit"
-    ]
-
+    print(f"Engine configurations: {', '.join(ENGINE_CONFIGS)} (run concurrently)")
     print("Sending commands to engine:")
-    for cmd in commands:
+    for cmd in COMMANDS:
         print(f"  > {cmd}")
     print()
     print("-" * 60)
     print()
 
-    # Create the input string
-    input_str = "\n".join(commands) + "\n"
+    # Run all engines at once; total time is the slowest engine, not the sum
+    results = asyncio.run(run_all_engines())
 
-    # Run the engine
-    try:
-        result = subprocess.run(
-            [sys.executable, "chess_rl_uci.py"],
-            input=input_str,
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
+    all_passed = True
+    for name, result in results.items():
+        print("=" * 60)
+        print(f"Engine: {name}")
+        print("=" * 60)
+
+        if isinstance(result, asyncio.TimeoutError):
+            print("❌ Error: Engine timed out (took more than 30 seconds)")
+            all_passed = False
+            continue
+        if isinstance(result, FileNotFoundError):
+            print("❌ Error: Could not find chess_rl_uci.py")
+            print("Make sure you're running this from the Chess_RL directory")
+            all_passed = False
+            continue
+        if isinstance(result, Exception):
+            print(f"❌ Error: {result}")
+            all_passed = False
+            continue
 
+        output, errors = result
         print("Engine Output:")
-        print(result.stdout)
+        print(output)
 
-        if result.stderr:
+        if errors:
             print("Errors:")
-            print(result.stderr)
-
-        # Check for expected responses
-        output = result.stdout
+            print(errors)
 
         print()
-        print("=" * 60)
         print("Validation:")
-        print("=" * 60)
+        if not validate_output(name, output):
+            all_passed = False
+        print()
 
-        checks = [
-            ("uciok" in output, "✓ UCI identification works"),
-            ("readyok" in output, "✓ Ready check works"),
-            ("bestmove" in output, "✓ Move generation works"),
-            ("e2e4" in output or "d2d4" in output or "g1f3" in output,
-             "✓ Engine makes reasonable moves (e4, d4, or Nf3)"),
-        ]
-
-        all_passed = True
-        for passed, message in checks:
-            status = "✅" if passed else "❌"
-            print(f"{status} {message}")
-            if not passed:
-                all_passed = False
+    assert all_passed, "Some UCI engine checks failed (see output above)"
 
-        print()
-        if all_passed:
-            print("🎉 All tests passed! Engine is working correctly.")
-            print()
-            print("Next steps:")
-            print("1. Install Banksia GUI: https://banksiagui.com/")
-            print("2. Add this engine to Banksia GUI")
-            print("3. Play a game!")
-        else:
-            print("❌ Some tests failed. Check the output above.")
-            return 1
-
-        return 0
-
-    except subprocess.TimeoutExpired:
-        print("❌ Error: Engine timed out (took more than 30 seconds)")
-        return 1
-    except FileNotFoundError:
-        print("❌ Error: Could not find chess_rl_uci.py")
-        print("Make sure you're running this from the Chess_RL directory")
-        return 1
-    except Exception as e:
-        print(f"❌ Error: {e}")
+    print("🎉 All tests passed! Engine is working correctly.")
+    print()
+    print("Next steps:")
+    print("1. Install Banksia GUI: https://banksiagui.com/")
+    print("2. Add this engine to Banksia GUI")
+    print("3. Play a game!")
+
+
+# Long-lived engine shared by the tests below, so the interpreter start-up
+# and module imports are paid once rather than per test
+_shared_engine = None
+
+# (position command, moves it contains) checked against the shared engine
+SHARED_ENGINE_POSITIONS = [
+    ("position startpos", []),
+    ("position startpos moves e2e4 e7e5", ["e2e4", "e7e5"]),
+    ("position startpos moves d2d4 d7d5 c2c4", ["d2d4", "d7d5", "c2c4"]),
+]
+
+
+def send_command(proc, cmd):
+    """Send one command line to an engine subprocess."""
+    proc.stdin.write(cmd + "\n")
+    proc.stdin.flush()
+
+
+def start_engine(script="chess_rl_uci.py", *args):
+    """
+    Start an engine subprocess whose stdout lines are collected on a thread.
+
+    readline() on the pipe blocks, so a thread moves each line into
+    proc.lines (None at EOF) and read_until can wait on it with a timeout.
+    """
+    proc = subprocess.Popen(
+        [sys.executable, script, *args],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        text=True
+    )
+    proc.lines = queue.Queue()
+
+    def pump():
+        for line in iter(proc.stdout.readline, ""):
+            proc.lines.put(line)
+        proc.lines.put(None)
+
+    threading.Thread(target=pump, daemon=True).start()
+    return proc
+
+
+def read_until(proc, token, timeout=30):
+    """Read engine output lines until one contains token; return all lines read."""
+    lines = []
+    deadline = time.time() + timeout
+    while True:
+        try:
+            line = proc.lines.get(timeout=max(deadline - time.time(), 0))
+        except queue.Empty:
+            break
+        if line is None:
+            raise RuntimeError(f"Engine closed stdout before sending '{token}'")
+        lines.append(line)
+        if token in line:
+            return lines
+    raise RuntimeError(f"Timed out waiting for '{token}' from engine")
+
+
+def get_shared_engine():
+    """Start the shared engine on first use (after the uci handshake) and return it."""
+    global _shared_engine
+    if _shared_engine is None or _shared_engine.poll() is not None:
+        _shared_engine = start_engine()
+        send_command(_shared_engine, "uci")
+        read_until(_shared_engine, "uciok")
+    return _shared_engine
+
+
+def close_shared_engine():
+    """Send quit to the shared engine and wait for it to exit."""
+    global _shared_engine
+    if _shared_engine is not None and _shared_engine.poll() is None:
+        send_command(_shared_engine, "quit")
+        _shared_engine.wait(timeout=5)
+    _shared_engine = None
+
+
+atexit.register(close_shared_engine)
+
+
+def test_shared_engine_positions():
+    """Each position gets a legal bestmove from the same (reset) engine process."""
+    engine = get_shared_engine()
+
+    for position, moves in SHARED_ENGINE_POSITIONS:
+        # Reset engine state between cases instead of restarting the process
+        send_command(engine, "ucinewgame")
+        send_command(engine, "isready")
+        read_until(engine, "readyok")
+
+        send_command(engine, position)
+        send_command(engine, "go depth 2")
+        bestmove = read_until(engine, "bestmove")[-1].split()[1]
+        print(f"{position} -> {bestmove}")
+
+        board = chess.Board()
+        for move in moves:
+            board.push_uci(move)
+        assert chess.Move.from_uci(bestmove) in board.legal_moves, \
+            f"Illegal bestmove {bestmove} after '{position}'"
+
+
+def test_stop_ends_infinite_search():
+    """'stop' ends 'go infinite' promptly, whatever whitespace separates the tokens."""
+    engine = get_shared_engine()
+
+    for go in ("go infinite", "go\tinfinite"):
+        send_command(engine, "ucinewgame")
+        send_command(engine, "setoption name Engine Type value minimax")
+        send_command(engine, "position startpos")
+        send_command(engine, "isready")
+        read_until(engine, "readyok")
+
+        # Stop once the search reports progress. An infinite search never ends
+        # by itself, so a bestmove before read_until's timeout means the stop
+        # was honoured.
+        send_command(engine, go)
+        read_until(engine, "info depth")
+        start = time.time()
+        send_command(engine, "stop")
+        bestmove = read_until(engine, "bestmove", timeout=10)[-1].split()[1]
+        print(f"{go!r}: stop -> bestmove {bestmove} in {time.time() - start:.2f}s")
+
+        assert chess.Move.from_uci(bestmove) in chess.Board().legal_moves
+
+
+# Time the engine may take beyond its budget. Generous on purpose so a loaded
+# test machine can't fail these: they only check that the budget is honoured
+# at all (without it a timed search deepens for minutes). test_time_budget
+# checks the budgets themselves exactly.
+TIME_SLACK = 3.0
+
+
+def timed_go(engine, position, go):
+    """Send a position and a go command; return (bestmove, seconds until it arrived)."""
+    send_command(engine, "ucinewgame")
+    send_command(engine, "setoption name Engine Type value minimax")
+    send_command(engine, position)
+    send_command(engine, "isready")
+    read_until(engine, "readyok")
+
+    start = time.time()
+    send_command(engine, go)
+    bestmove = read_until(engine, "bestmove", timeout=30)[-1].split()[1]
+    return bestmove, time.time() - start
+
+
+def test_go_movetime_within_budget():
+    """'go movetime' answers within the requested time plus slack."""
+    engine = get_shared_engine()
+    bestmove, elapsed = timed_go(engine, "position startpos", "go movetime 500")
+    print(f"go movetime 500 -> {bestmove} in {elapsed:.2f}s")
+    assert elapsed < 0.5 + TIME_SLACK, f"movetime 500 took {elapsed:.2f}s"
+    assert chess.Move.from_uci(bestmove) in chess.Board().legal_moves
+
+
+def test_go_clock_within_budget():
+    """With wtime/btime and movestogo, the side to move uses its share of its own clock."""
+    engine = get_shared_engine()
+
+    # White: 3000ms over 10 moves -> 300ms
+    bestmove, elapsed = timed_go(engine, "position startpos",
+                                 "go wtime 3000 btime 60000 movestogo 10")
+    print(f"White 300ms budget -> {bestmove} in {elapsed:.2f}s")
+    assert elapsed < 0.3 + TIME_SLACK, f"300ms budget took {elapsed:.2f}s"
+
+    # Black after 1.e4: 2000ms over 10 moves -> 200ms (White's big clock is ignored)
+    board = chess.Board()
+    board.push_uci("e2e4")
+    bestmove, elapsed = timed_go(engine, "position startpos moves e2e4",
+                                 "go wtime 600000 btime 2000 movestogo 10")
+    print(f"Black 200ms budget -> {bestmove} in {elapsed:.2f}s")
+    assert elapsed < 0.2 + TIME_SLACK, f"200ms budget took {elapsed:.2f}s"
+    assert chess.Move.from_uci(bestmove) in board.legal_moves
+
+
+def test_time_budget():
+    """time_budget() turns go parameters into seconds to think."""
+    engine = UCIEngine()
+    budget = lambda go: engine.time_budget(engine.parse_go_params(go.split()))
+
+    assert budget("movetime 1000") == (1000 - MOVE_OVERHEAD_MS) / 1000
+    assert budget("movetime 10") == 0.001  # Never less than 1ms
+    assert budget("wtime 60000 btime 1000 movestogo 20") == 3.0
+    assert budget("wtime 60000 winc 1000 movestogo 20") == 3.75
+    assert budget("wtime 30000") == 1.0  # movestogo defaults to 30
+    assert budget("wtime 100 movestogo 1") == (100 - MOVE_OVERHEAD_MS) / 1000  # Keep the reserve
+    assert budget("depth 3") is None
+    assert budget("infinite") is None
+
+    engine.board.push_uci("e2e4")  # Black to move: btime/binc apply
+    assert budget("wtime 60000 btime 6000 movestogo 20") == 0.3
+
+
+def test_stopped_search_restores_board():
+    """A search cut off by its deadline or a stop leaves the board as it found it."""
+    engine = UCIEngine()
+    engine.handle_position(["startpos", "moves", "e2e4", "e7e5", "g1f3"])
+    fen = engine.board.fen()
+    stack = list(engine.board.move_stack)
+
+    # Deadline: depth 32 can't finish in 0.2s, so an iteration is abandoned
+    move = engine.iterative_deepening(32, budget=0.2)
+    assert move in engine.board.legal_moves
+    assert engine.board.fen() == fen and engine.board.move_stack == stack
+
+    # Stop: set from another thread while the search runs
+    engine.stop_event.clear()
+    timer = threading.Timer(0.3, engine.stop_event.set)
+    timer.start()
+    start = time.time()
+    move = engine.iterative_deepening(32)
+    timer.join()
+    assert time.time() - start < 0.3 + TIME_SLACK
+    assert move in engine.board.legal_moves
+    assert engine.board.fen() == fen and engine.board.move_stack == stack
+
+
+def test_position_updates_match_rebuild():
+    """
+    Incremental 'position' updates leave the same state as a fresh engine.
+
+    Covers extending the previous move list (with the SAN 'go' appends for our
+    own move), takebacks, illegal and malformed moves, and switching between
+    startpos and FEN heads.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        pgn_path = os.path.join(tmp, "games.pgn")
+
+        for record_san in (True, False):
+            engine = UCIEngine(pgn_log_file=pgn_path)
+            engine.pgn_export_enabled = record_san
+
+            def check(parts, label):
+                engine.handle_position(parts)
+                fresh = UCIEngine(pgn_log_file=pgn_path)
+                fresh.pgn_export_enabled = record_san
+                fresh.handle_position(parts)
+                assert engine.board.fen() == fresh.board.fen(), f"{label}: board differs"
+                assert engine.board.move_stack == fresh.board.move_stack, f"{label}: move stack differs"
+                assert engine.game_moves == fresh.game_moves, f"{label}: game_moves differ"
+
+            # A random game sent one ply at a time, the way a GUI does
+            rng = random.Random(1)
+            board = chess.Board()
+            moves = []
+            while len(moves) < 60:
+                move = rng.choice(list(board.legal_moves))
+                board.push(move)
+                if board.is_game_over():  # Keep the game going: a finished one is saved and reset
+                    board.pop()
+                    break
+                moves.append(move.uci())
+                check(["startpos", "moves"] + moves, f"extend to ply {len(moves)}")
+                if record_san and len(moves) % 2:
+                    # 'go' records the SAN of our reply before the GUI resends it
+                    engine.game_moves.append(board.san(rng.choice(list(board.legal_moves))))
+
+            check(["startpos", "moves"] + moves[:-2], "takeback")
+            check(["startpos", "moves"] + moves, "extend after takeback")
+            board.pop()
+            alternative = next(m.uci() for m in board.legal_moves if m.uci() != moves[-1])
+            check(["startpos", "moves"] + moves[:-1] + [alternative], "different last move")
+            check(["startpos", "moves"] + moves, "back to the game line")
+            check(["startpos", "moves"] + moves[:-1] + [moves[-2]], "illegal move")
+            check(["startpos", "moves"] + moves, "extend after illegal move")
+            check(["startpos", "moves"] + moves + ["e9e4"], "malformed move")
+            check(["startpos", "moves"] + moves, "extend after malformed move")
+            check(["startpos", "moves", "e2e4"], "different line")
+
+            # The same moves from a FEN head are a different game
+            fen = chess.Board().fen()
+            engine.handle_ucinewgame()
+            check(["fen"] + fen.split(), "FEN head")
+            check(["fen"] + fen.split() + ["moves"] + moves[:4], "FEN head with moves")
+            check(["fen"] + fen.split() + ["moves"] + moves[:6], "extend FEN head")
+            check(["startpos", "moves"] + moves[:6], "startpos after FEN head")
+            other = "6k1/5ppp/8/8/8/8/5PPP/4R1K1 w - - 0 1"
+            check(["fen"] + other.split() + ["moves", "g1f1"], "other FEN head")
+            check(["fen"] + other.split() + ["moves", "g1f1", "g8f8"], "extend other FEN head")
+
+
+def main():
+    """Run the tests as a script; return the process exit status."""
+    try:
+        test_uci_engine()
+        test_shared_engine_positions()
+        test_stop_ends_infinite_search()
+        test_go_movetime_within_budget()
+        test_go_clock_within_budget()
+        test_time_budget()
+        test_stopped_search_restores_board()
+        test_position_updates_match_rebuild()
+    except AssertionError as e:
+        print(f"❌ {e}")
         return 1
+    return 0
 
 
 if __name__ == "__main__":
-    exit(test_uci_engine())
+    exit(main())
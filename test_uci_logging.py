@@ -3,10 +3,11 @@
 Test script for UCI logging features.
 """
 
-import subprocess
-import time
 import os
 
+from test_uci import start_engine, read_until
+
+
 def test_uci_logging():
     """Test UCI transaction logging and PGN export."""
 
@@ -19,41 +20,34 @@ def test_uci_logging():
             os.remove(f)
 
     # Start the UCI engine with logging enabled
-    proc = subprocess.Popen(
-        ["python3", "uci/engine.py", "--uci-log", "test_uci.log", "--pgn-log", "test_games.pgn"],
-        stdin=subprocess.PIPE,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-        bufsize=1
-    )
+    proc = start_engine("uci/engine.py", "--uci-log", "test_uci.log", "--pgn-log", "test_games.pgn")
 
     def send_command(cmd):
-        """Send a command and read response."""
+        """Send a command to the engine."""
         print(f">> {cmd}")
         proc.stdin.write(cmd + "\n")
         proc.stdin.flush()
-        time.sleep(0.1)  # Give it time to process
 
     # Initialize engine
     send_command("uci")
-    time.sleep(0.2)
+    read_until(proc, "uciok")
 
     send_command("isready")
-    time.sleep(0.1)
+    read_until(proc, "readyok")
 
     # Start a new game
     send_command("ucinewgame")
     send_command("isready")
+    read_until(proc, "readyok")
 
     # Play a few moves
     send_command("position startpos moves e2e4")
     send_command("go depth 3")
-    time.sleep(0.5)
+    read_until(proc, "bestmove")
 
     send_command("position startpos moves e2e4 e7e5")
     send_command("go depth 3")
-    time.sleep(0.5)
+    read_until(proc, "bestmove")
 
     # Quit
     send_command("quit")
@@ -30,14 +30,44 @@ import chess
 import random
 import argparse
 import os
+import queue
+import re
+import threading
+import time
+import traceback
 from datetime import datetime
-from typing import Optional, TextIO
+from typing import Callable, Dict, List, Optional, TextIO, Tuple
 
-# Import our engine modules
-sys.path.insert(0, '/home/user/Chess_RL')
-from engine.evaluator import evaluate, best_move_material
-from search.minimax import best_move_minimax
-from search.mcts import best_move_mcts
+# Make our engine modules importable (add project root to path). They are
+# imported on first use, so the 'uci' handshake doesn't wait for search code
+# the selected engine type may never need.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Responses the GUI blocks on; stdout is flushed after these
+_FLUSH_PREFIXES = ("uciok", "readyok", "bestmove")
+
+# Searches running longer than this (seconds) flush each 'info' line, so the
+# GUI sees progress; shorter ones leave them buffered until bestmove
+INFO_FLUSH_AFTER = 0.5
+
+# Upper limit for the 'MCTS Workers' option
+MAX_MCTS_WORKERS = 64
+
+# Upper limit for the 'Seed' option
+MAX_SEED = 2**31 - 1
+
+# Time management: deepest iteration of a timed search, the clock reserve
+# for GUI/pipe latency, and the moves left assumed when 'movestogo' is absent
+MAX_SEARCH_DEPTH = 32
+MOVE_OVERHEAD_MS = 50
+DEFAULT_MOVES_TO_GO = 30
+
+# 'setoption name <name> value <value>': name and value (value may be empty)
+_SETOPT_RE = re.compile(r"name\s+(.+?)\s+value(?:\s+(.*?))?\s*$")
+
+# 'go' parameters that take an integer argument
+_GO_INT_PARAMS = frozenset(("depth", "movetime", "wtime", "btime", "winc", "binc",
+                            "movestogo", "nodes", "mate"))
 
 
 class UCIEngine:
@@ -49,12 +79,61 @@ class UCIEngine:
         self.search_depth = 3  # default
         self.mcts_simulations = 200  # default for MCTS
         self.mcts_use_evaluator = True  # default: use evaluator rollouts
+        self.mcts_workers = 1  # default: single process (keeps subtree reuse)
         self.debug = False
 
+        # Random number generator for every engine's choices ('Seed' option;
+        # 0 = seeded from the OS, so games differ)
+        self.seed = 0
+        self._rng = random.Random()
+
+        # Minimax transposition table, kept across 'go' commands of one game
+        # (created with the minimax engine on first use)
+        self.tt = None
+        # Node counter for the current minimax search (reported in 'info' lines)
+        self.nodes_searched = [0]
+
+        # Search functions, resolved by the lazy imports in get_best_move
+        self._material_fn: Optional[Callable] = None
+        self._minimax_fn: Optional[Callable] = None
+        self._mcts_fn: Optional[Callable] = None
+        self._mcts_subtree_fn: Optional[Callable] = None
+        self._mcts_parallel_fn: Optional[Callable] = None
+
+        # MCTS tree from the last search, reused when the game continues from it
+        self.mcts_root = None
+
+        # Last 'position' command applied to self.board (start tokens and
+        # move list); None when the board no longer matches it
+        self._position_head: List[str] = []
+        self._position_moves: Optional[List[str]] = None
+        # Parsed moves by UCI string (Move objects are immutable, so shared)
+        self._move_cache: Dict[str, chess.Move] = {}
+
+        # Set by the stdin reader on 'stop'/'quit' to abort a running search;
+        # run() takes its commands from input_q. 'go' commands are counted as
+        # the reader sees them and as searches start, so that a stop only
+        # ends the search of the 'go' it followed.
+        self.stop_event = threading.Event()
+        self.input_q: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._stop_lock = threading.Lock()
+        self._go_read = 0
+        self._go_started = 0
+        self._stop_target = 0
+
         # UCI transaction logging
         self.uci_log_enabled = False
         self.uci_log_file_path = uci_log_file or "uci_transactions.log"
         self.uci_log_handle: Optional[TextIO] = None
+        # Log lines are buffered in memory and written out in batches
+        self._uci_log_buf: List[str] = []
+        self._uci_log_bytes = 0
+        self._uci_log_lock = threading.Lock()
+        self._uci_log_stop = threading.Event()
+        self._uci_log_thread: Optional[threading.Thread] = None
+        # Timestamp prefix ("YYYY-MM-DD HH:MM:SS") cached for the current second
+        self._ts_cached_sec = -1
+        self._ts_cached_prefix = ""
 
         # PGN game export
         self.pgn_export_enabled = False
@@ -62,10 +141,46 @@ class UCIEngine:
         self.pgn_export_handle: Optional[TextIO] = None
 
         # Game state tracking for PGN
-        self.game_moves = []  # List of moves in SAN notation
+        self.game_moves = []  # List of moves in SAN notation (kept while PGN export is on)
         self.game_start_fen = None
         self.game_result = "*"  # Ongoing game
 
+        # Engine type -> search method (see get_best_move)
+        self._engines: Dict[str, Callable] = {
+            "random": self._search_random,
+            "material": self._search_material,
+            "minimax": self._search_minimax,
+            "mcts": self._search_mcts,
+        }
+
+        # UCI option name -> setter taking the option's string value
+        self._option_handlers: Dict[str, Callable[[str], None]] = {
+            "Engine Type": self._set_engine_type,
+            "Search Depth": self._set_search_depth,
+            "MCTS Simulations": self._set_mcts_simulations,
+            "MCTS Use Evaluator": self._set_mcts_use_evaluator,
+            "MCTS Workers": self._set_mcts_workers,
+            "Seed": self._set_seed,
+            "Debug": self._set_debug,
+            "UCI Log": self._set_uci_log,
+            "UCI Log File": self._set_uci_log_file,
+            "PGN Export": self._set_pgn_export,
+            "PGN Export File": self._set_pgn_export_file,
+        }
+
+        # UCI command word -> handler taking the remaining tokens
+        self._cmd_handlers: Dict[str, Callable[[str], None]] = {
+            "uci": lambda rest: self.handle_uci(),
+            "debug": self._cmd_debug,
+            "isready": lambda rest: self.handle_isready(),
+            "setoption": self._cmd_setoption,
+            "ucinewgame": lambda rest: self.handle_ucinewgame(),
+            "position": lambda rest: self.handle_position(rest.split()),
+            "go": lambda rest: self.handle_go(rest.split()),
+            "stop": lambda rest: self.handle_stop(),
+            "quit": lambda rest: self.handle_quit(),
+        }
+
         # Auto-enable logging if file paths provided via CLI
         if uci_log_file:
             self.enable_uci_log()
@@ -75,19 +190,26 @@ class UCIEngine:
     def log_debug(self, message: str):
         """Log debug messages if debug mode is enabled."""
         if self.debug:
-            print(f"info string DEBUG: {message}", flush=True)
+            sys.stdout.write(f"info string DEBUG: {message}\n")
 
     def enable_uci_log(self):
         """Enable UCI transaction logging."""
         if not self.uci_log_enabled:
             try:
-                self.uci_log_handle = open(self.uci_log_file_path, 'a', encoding='utf-8')
+                # Block-buffered: lines are written in batches by _flush_uci_log()
+                self.uci_log_handle = open(self.uci_log_file_path, 'a', buffering=65536,
+                                           encoding='utf-8')
                 self.uci_log_enabled = True
                 timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                 self.uci_log_handle.write(f"\n{'='*60}\n")
                 self.uci_log_handle.write(f"UCI Log started: {timestamp}\n")
                 self.uci_log_handle.write(f"{'='*60}\n")
                 self.uci_log_handle.flush()
+
+                # Background flusher so the log stays current during long searches
+                self._uci_log_stop.clear()
+                self._uci_log_thread = threading.Thread(target=self._uci_log_flusher, daemon=True)
+                self._uci_log_thread.start()
                 self.log_debug(f"UCI logging enabled: {self.uci_log_file_path}")
             except Exception as e:
                 self.log_debug(f"Failed to enable UCI log: {e}")
@@ -95,6 +217,11 @@ class UCIEngine:
     def disable_uci_log(self):
         """Disable UCI transaction logging."""
         if self.uci_log_enabled and self.uci_log_handle:
+            self._uci_log_stop.set()
+            if self._uci_log_thread:
+                self._uci_log_thread.join()
+                self._uci_log_thread = None
+            self._flush_uci_log()
             timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             self.uci_log_handle.write(f"\nUCI Log ended: {timestamp}\n")
             self.uci_log_handle.close()
@@ -105,13 +232,50 @@ class UCIEngine:
     def log_uci_transaction(self, direction: str, message: str):
         """Log a UCI transaction (IN or OUT)."""
         if self.uci_log_enabled and self.uci_log_handle:
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
-            self.uci_log_handle.write(f"[{timestamp}] {direction:3s}: {message}\n")
+            line = f"[{self._log_timestamp()}] {direction:3s}: {message}\n"
+            with self._uci_log_lock:
+                self._uci_log_buf.append(line)
+                self._uci_log_bytes += len(line)
+                buffer_full = self._uci_log_bytes > 8192
+            if buffer_full:
+                self._flush_uci_log()
+
+    def _log_timestamp(self) -> str:
+        """Current time as "YYYY-MM-DD HH:MM:SS.mmm", formatting the date part once per second."""
+        now = time.time()
+        sec = int(now)
+        if sec != self._ts_cached_sec:
+            self._ts_cached_sec = sec
+            self._ts_cached_prefix = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec))
+        return f"{self._ts_cached_prefix}.{int((now - sec) * 1000):03d}"
+
+    def _flush_uci_log(self):
+        """Write buffered UCI log lines to the log file in one batch."""
+        with self._uci_log_lock:
+            if not self._uci_log_buf or not self.uci_log_handle:
+                return
+            self.uci_log_handle.write("".join(self._uci_log_buf))
             self.uci_log_handle.flush()
+            self._uci_log_buf.clear()
+            self._uci_log_bytes = 0
+
+    def _uci_log_flusher(self):
+        """Background thread: flush the UCI log buffer every 50ms until stopped."""
+        while not self._uci_log_stop.wait(0.05):
+            self._flush_uci_log()
+
+    def uci_print(self, message: str, flush: bool = False):
+        """
+        Write a line to stdout and log the transaction.
 
-    def uci_print(self, message: str, **kwargs):
-        """Print to stdout and log the transaction."""
-        print(message, **kwargs)
+        Args:
+            message: Line to send (without newline)
+            flush: Flush stdout even if the GUI isn't waiting on this line
+        """
+        sys.stdout.write(message + "\n")
+        # stdout is block-buffered; push it out when the GUI is waiting on this line
+        if flush or message.startswith(_FLUSH_PREFIXES):
+            sys.stdout.flush()
         # Log output (strip info string DEBUG messages to avoid duplication)
         if not message.startswith("info string DEBUG:"):
             self.log_uci_transaction("OUT", message)
@@ -147,21 +311,25 @@ class UCIEngine:
             return  # No game to save
 
         try:
-            # Write PGN headers
-            self.pgn_export_handle.write(f'[Event "Chess_RL Game"]\n')
-            self.pgn_export_handle.write(f'[Site "Local"]\n')
-            self.pgn_export_handle.write(f'[Date "{datetime.now().strftime("%Y.%m.%d")}"]\n')
-            self.pgn_export_handle.write(f'[Round "-"]\n')
-            self.pgn_export_handle.write(f'[White "Player"]\n')
-            self.pgn_export_handle.write(f'[Black "Chess_RL {self.engine_type}"]\n')
-            self.pgn_export_handle.write(f'[Result "{self.game_result}"]\n')
+            # Build the whole record in memory and hand it to the file once
+            parts = []
+            append = parts.append
+
+            # PGN headers
+            append('[Event "Chess_RL Game"]\n')
+            append('[Site "Local"]\n')
+            append(f'[Date "{datetime.now().strftime("%Y.%m.%d")}"]\n')
+            append('[Round "-"]\n')
+            append('[White "Player"]\n')
+            append(f'[Black "Chess_RL {self.engine_type}"]\n')
+            append(f'[Result "{self.game_result}"]\n')
 
             if self.game_start_fen and self.game_start_fen != chess.STARTING_FEN:
-                self.pgn_export_handle.write(f'[FEN "{self.game_start_fen}"]\n')
-                self.pgn_export_handle.write(f'[SetUp "1"]\n')
+                append(f'[FEN "{self.game_start_fen}"]\n')
+                append('[SetUp "1"]\n')
 
-            # Write moves
-            self.pgn_export_handle.write('\n')
+            # Moves
+            append('\n')
             if self.game_moves:
                 # Format moves with move numbers
                 move_text = []
@@ -171,22 +339,28 @@ class UCIEngine:
                     else:
                         move_text.append(move)
 
-                # Wrap at 80 characters
-                line = ""
+                # Wrap at 80 characters (line_len counts each token plus its
+                # trailing space, so long games stay linear to format)
+                lines = []
+                buf = []
+                line_len = 0
                 for token in move_text:
-                    if len(line) + len(token) + 1 > 80:
-                        self.pgn_export_handle.write(line.rstrip() + '\n')
-                        line = token + " "
+                    if buf and line_len + len(token) + 1 > 80:
+                        lines.append(" ".join(buf))
+                        buf = [token]
+                        line_len = len(token) + 1
                     else:
-                        line += token + " "
-
-                if line:
-                    self.pgn_export_handle.write(line.rstrip())
+                        buf.append(token)
+                        line_len += len(token) + 1
 
-                self.pgn_export_handle.write(f" {self.game_result}\n\n")
+                if buf:
+                    lines.append(" ".join(buf))
+                append("\n".join(lines))
+                append(f" {self.game_result}\n\n")
             else:
-                self.pgn_export_handle.write(f"{self.game_result}\n\n")
+                append(f"{self.game_result}\n\n")
 
+            self.pgn_export_handle.write("".join(parts))
             self.pgn_export_handle.flush()
             self.log_debug(f"Game saved to PGN ({len(self.game_moves)} moves)")
         except Exception as e:
@@ -194,104 +368,162 @@ class UCIEngine:
 
     def handle_uci(self):
         """Handle 'uci' command - identify the engine."""
-        self.uci_print("id name Chess_RL v0.1.0")
-        self.uci_print("id author Your Name")
-        self.uci_print("")
-
-        # Declare available options
-        self.uci_print("option name Engine Type type combo default minimax var random var material var minimax var mcts")
-        self.uci_print("option name Search Depth type spin default 3 min 1 max 6")
-        self.uci_print("option name MCTS Simulations type spin default 200 min 50 max 1000")
-        self.uci_print("option name MCTS Use Evaluator type check default true")
-        self.uci_print("option name Debug type check default false")
-
-        # Logging options
-        self.uci_print("option name UCI Log type check default false")
-        self.uci_print(f"option name UCI Log File type string default {self.uci_log_file_path}")
-        self.uci_print("option name PGN Export type check default false")
-        self.uci_print(f"option name PGN Export File type string default {self.pgn_export_file_path}")
-        self.uci_print("")
-
-        self.uci_print("uciok", flush=True)
+        lines = [
+            "id name Chess_RL v0.1.0",
+            "id author Your Name",
+            "",
+
+            # Declare available options
+            "option name Engine Type type combo default minimax var random var material var minimax var mcts",
+            "option name Search Depth type spin default 3 min 1 max 6",
+            "option name MCTS Simulations type spin default 200 min 50 max 1000",
+            "option name MCTS Use Evaluator type check default true",
+            f"option name MCTS Workers type spin default 1 min 1 max {MAX_MCTS_WORKERS}",
+            f"option name Seed type spin default 0 min 0 max {MAX_SEED}",
+            "option name Debug type check default false",
+
+            # Logging options
+            "option name UCI Log type check default false",
+            f"option name UCI Log File type string default {self.uci_log_file_path}",
+            "option name PGN Export type check default false",
+            f"option name PGN Export File type string default {self.pgn_export_file_path}",
+            "",
+
+            "uciok",
+        ]
+
+        # Send the whole handshake with one write; log it line by line as usual
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+        for line in lines:
+            self.log_uci_transaction("OUT", line)
 
     def handle_debug(self, on: bool):
         """Handle 'debug' command."""
         self.debug = on
         self.log_debug(f"Debug mode set to {on}")
 
+    def _cmd_debug(self, rest: str):
+        """Parse 'debug [on | off]'."""
+        self.handle_debug(rest.split(None, 1)[:1] == ["on"])
+
+    def _cmd_setoption(self, rest: str):
+        """Parse 'setoption name <name> value <value>'."""
+        # One regex match instead of splitting and re-joining the tokens
+        match = _SETOPT_RE.match(rest)
+        if match:
+            self.handle_setoption(match.group(1), match.group(2) or "")
+
     def handle_isready(self):
         """Handle 'isready' command - confirm engine is ready."""
-        self.uci_print("readyok", flush=True)
+        self.uci_print("readyok")
 
     def handle_setoption(self, name: str, value: str):
         """Handle 'setoption' command - configure engine options."""
-        if name == "Engine Type":
-            if value in ["random", "material", "minimax", "mcts"]:
-                self.engine_type = value
-                self.log_debug(f"Engine type set to {value}")
-            else:
-                self.log_debug(f"Unknown engine type: {value}")
-
-        elif name == "Search Depth":
-            try:
-                depth = int(value)
-                if 1 <= depth <= 6:
-                    self.search_depth = depth
-                    self.log_debug(f"Search depth set to {depth}")
-                else:
-                    self.log_debug(f"Search depth out of range: {depth}")
-            except ValueError:
-                self.log_debug(f"Invalid depth value: {value}")
+        handler = self._option_handlers.get(name)
+        if handler:
+            handler(value)
+        else:
+            self.log_debug(f"Unknown option: {name}")
 
-        elif name == "MCTS Simulations":
-            try:
-                sims = int(value)
-                if 50 <= sims <= 1000:
-                    self.mcts_simulations = sims
-                    self.log_debug(f"MCTS simulations set to {sims}")
-                else:
-                    self.log_debug(f"MCTS simulations out of range: {sims}")
-            except ValueError:
-                self.log_debug(f"Invalid MCTS simulations value: {value}")
+    def _set_engine_type(self, value: str):
+        """Set 'Engine Type' (random, material, minimax or mcts)."""
+        if value in self._engines:
+            self.engine_type = value
+            self.log_debug(f"Engine type set to {value}")
+        else:
+            self.log_debug(f"Unknown engine type: {value}")
 
-        elif name == "MCTS Use Evaluator":
-            self.mcts_use_evaluator = (value.lower() == "true")
-            self.log_debug(f"MCTS Use Evaluator set to {self.mcts_use_evaluator}")
+    def _set_search_depth(self, value: str):
+        """Set 'Search Depth' (1-6)."""
+        try:
+            depth = int(value)
+            if 1 <= depth <= 6:
+                self.search_depth = depth
+                self.log_debug(f"Search depth set to {depth}")
+            else:
+                self.log_debug(f"Search depth out of range: {depth}")
+        except ValueError:
+            self.log_debug(f"Invalid depth value: {value}")
 
-        elif name == "Debug":
-            self.debug = (value.lower() == "true")
-            self.log_debug(f"Debug set to {self.debug}")
+    def _set_mcts_simulations(self, value: str):
+        """Set 'MCTS Simulations' (50-1000)."""
+        try:
+            sims = int(value)
+            if 50 <= sims <= 1000:
+                self.mcts_simulations = sims
+                self.log_debug(f"MCTS simulations set to {sims}")
+            else:
+                self.log_debug(f"MCTS simulations out of range: {sims}")
+        except ValueError:
+            self.log_debug(f"Invalid MCTS simulations value: {value}")
 
-        elif name == "UCI Log":
-            if value.lower() == "true":
-                self.enable_uci_log()
+    def _set_mcts_workers(self, value: str):
+        """Set 'MCTS Workers' (1-MAX_MCTS_WORKERS); more than 1 runs root-parallel MCTS."""
+        try:
+            workers = int(value)
+            if 1 <= workers <= MAX_MCTS_WORKERS:
+                self.mcts_workers = workers
+                self.log_debug(f"MCTS workers set to {workers}")
             else:
-                self.disable_uci_log()
-
-        elif name == "UCI Log File":
-            self.uci_log_file_path = value
-            self.log_debug(f"UCI log file path set to {value}")
-            # If logging is already enabled, restart it with new file
-            if self.uci_log_enabled:
-                self.disable_uci_log()
-                self.enable_uci_log()
-
-        elif name == "PGN Export":
-            if value.lower() == "true":
-                self.enable_pgn_export()
+                self.log_debug(f"MCTS workers out of range: {workers}")
+        except ValueError:
+            self.log_debug(f"Invalid MCTS workers value: {value}")
+
+    def _set_seed(self, value: str):
+        """Set 'Seed' (0-MAX_SEED); nonzero makes the engines' random choices reproducible."""
+        try:
+            seed = int(value)
+            if 0 <= seed <= MAX_SEED:
+                self.seed = seed
+                self._rng.seed(seed or None)
+                self.log_debug(f"Seed set to {seed}")
             else:
-                self.disable_pgn_export()
+                self.log_debug(f"Seed out of range: {seed}")
+        except ValueError:
+            self.log_debug(f"Invalid seed value: {value}")
+
+    def _set_mcts_use_evaluator(self, value: str):
+        """Set 'MCTS Use Evaluator' (true/false)."""
+        self.mcts_use_evaluator = (value.lower() == "true")
+        self.log_debug(f"MCTS Use Evaluator set to {self.mcts_use_evaluator}")
+
+    def _set_debug(self, value: str):
+        """Set 'Debug' (true/false)."""
+        self.debug = (value.lower() == "true")
+        self.log_debug(f"Debug set to {self.debug}")
+
+    def _set_uci_log(self, value: str):
+        """Set 'UCI Log' - enable or disable transaction logging."""
+        if value.lower() == "true":
+            self.enable_uci_log()
+        else:
+            self.disable_uci_log()
 
-        elif name == "PGN Export File":
-            self.pgn_export_file_path = value
-            self.log_debug(f"PGN export file path set to {value}")
-            # If export is already enabled, restart it with new file
-            if self.pgn_export_enabled:
-                self.disable_pgn_export()
-                self.enable_pgn_export()
+    def _set_uci_log_file(self, value: str):
+        """Set 'UCI Log File' path."""
+        self.uci_log_file_path = value
+        self.log_debug(f"UCI log file path set to {value}")
+        # If logging is already enabled, restart it with new file
+        if self.uci_log_enabled:
+            self.disable_uci_log()
+            self.enable_uci_log()
 
+    def _set_pgn_export(self, value: str):
+        """Set 'PGN Export' - enable or disable PGN game export."""
+        if value.lower() == "true":
+            self.enable_pgn_export()
         else:
-            self.log_debug(f"Unknown option: {name}")
+            self.disable_pgn_export()
+
+    def _set_pgn_export_file(self, value: str):
+        """Set 'PGN Export File' path."""
+        self.pgn_export_file_path = value
+        self.log_debug(f"PGN export file path set to {value}")
+        # If export is already enabled, restart it with new file
+        if self.pgn_export_enabled:
+            self.disable_pgn_export()
+            self.enable_pgn_export()
 
     def handle_ucinewgame(self):
         """Handle 'ucinewgame' command - prepare for new game."""
@@ -299,11 +531,19 @@ class UCIEngine:
         if self.pgn_export_enabled and (self.game_moves or self.game_start_fen):
             self.save_pgn_game()
 
-        # Reset board and game state
-        self.board = chess.Board()
+        # Game boundary: push buffered log lines out to disk
+        self._flush_uci_log()
+
+        # Reset board and game state (in place: no new Board per game)
+        self.board.reset()
         self.game_moves = []
         self.game_start_fen = chess.STARTING_FEN
         self.game_result = "*"
+        if self.tt is not None:
+            self.tt.clear()
+        self.mcts_root = None
+        self._position_moves = None
+        self._move_cache.clear()
         self.log_debug("New game started")
 
     def handle_position(self, parts: list):
@@ -312,106 +552,282 @@ class UCIEngine:
 
         Format: position [fen <fenstring> | startpos] moves <move1> ... <movei>
         """
-        idx = 0
-
-        # Parse position type
-        if parts[idx] == "startpos":
-            self.board = chess.Board()
-            self.game_start_fen = chess.STARTING_FEN
-            idx += 1
-        elif parts[idx] == "fen":
-            # FEN string follows
-            fen_parts = []
-            idx += 1
-            while idx < len(parts) and parts[idx] != "moves":
-                fen_parts.append(parts[idx])
-                idx += 1
-            fen = " ".join(fen_parts)
-            try:
-                self.board = chess.Board(fen)
-                self.game_start_fen = fen
-            except ValueError as e:
-                self.log_debug(f"Invalid FEN: {e}")
-                return
-
-        # Reset game moves when setting position (position command gives full state)
-        self.game_moves = []
+        # Split at "moves" once: everything before it describes the position
+        try:
+            moves_idx = parts.index("moves")
+        except ValueError:
+            moves_idx = len(parts)
+        head = parts[:moves_idx]
+        moves = parts[moves_idx + 1:]
+        record_san = self.pgn_export_enabled
+
+        # During a game the GUI resends the whole move list each time. If it
+        # only extends the last one from the same start, play just the new
+        # moves (game_moves must still hold SAN for the old ones if exported).
+        prev = self._position_moves
+        self._position_moves = None
+        if (prev is not None and head == self._position_head
+                and moves[:len(prev)] == prev
+                and len(self.board.move_stack) == len(prev)
+                and (not record_san or len(self.game_moves) >= len(prev))):
+            del self.game_moves[len(prev):]  # SAN of our own move, added by 'go'
+            new_moves = moves[len(prev):]
+        else:
+            # Parse position type
+            if head and head[0] == "startpos":
+                self.board.reset()
+                self.game_start_fen = chess.STARTING_FEN
+            elif head and head[0] == "fen":
+                # FEN string follows
+                fen = " ".join(head[1:])
+                try:
+                    self.board = chess.Board(fen)
+                    self.game_start_fen = fen
+                except ValueError as e:
+                    self.log_debug(f"Invalid FEN: {e}")
+                    return
 
-        # Parse moves if present and track them for PGN
-        if idx < len(parts) and parts[idx] == "moves":
-            idx += 1
-            # Create a temporary board to track SAN notation
-            temp_board = chess.Board(self.game_start_fen) if self.game_start_fen else chess.Board()
+            # Reset game moves when setting position (position command gives full state)
+            self.game_moves = []
+            new_moves = moves
 
-            while idx < len(parts):
-                move_str = parts[idx]
-                try:
-                    move = chess.Move.from_uci(move_str)
-                    if move in temp_board.legal_moves:
-                        # Store in SAN notation for PGN
-                        san_move = temp_board.san(move)
-                        self.game_moves.append(san_move)
-                        temp_board.push(move)
-                        self.board.push(move)
+        # Parse moves if present; SAN is only worked out when it is exported to PGN
+        board = self.board
+        move_cache = self._move_cache
+        for move_str in new_moves:
+            try:
+                move = move_cache.get(move_str)
+                if move is None:
+                    move = move_cache[move_str] = chess.Move.from_uci(move_str)
+                if board.is_legal(move):
+                    if record_san:
+                        # Push and record SAN in one step on the live board
+                        self.game_moves.append(board.san_and_push(move))
                     else:
-                        self.log_debug(f"Illegal move: {move_str}")
-                        return
-                except ValueError as e:
-                    self.log_debug(f"Invalid move format: {move_str} - {e}")
+                        board.push(move)
+                else:
+                    self.log_debug(f"Illegal move: {move_str}")
                     return
-                idx += 1
+            except ValueError as e:
+                self.log_debug(f"Invalid move format: {move_str} - {e}")
+                return
 
+        self._position_head = head
+        self._position_moves = moves
         self.log_debug(f"Position set: {self.board.fen()}")
 
         # Check if the position is a game-ending state (for PGN export)
         if self.pgn_export_enabled and self.game_moves:
-            if self.board.is_checkmate():
-                self.game_result = "1-0" if self.board.turn == chess.BLACK else "0-1"
-                self.save_pgn_game()
-                # Reset for next game
-                self.game_moves = []
-                self.game_start_fen = None
-                self.game_result = "*"
-            elif self.board.is_stalemate() or self.board.is_insufficient_material():
-                self.game_result = "1/2-1/2"
-                self.save_pgn_game()
-                # Reset for next game
-                self.game_moves = []
-                self.game_start_fen = None
-                self.game_result = "*"
-            elif self.board.is_fifty_moves() or self.board.is_repetition():
-                self.game_result = "1/2-1/2"
+            result = self.game_over_result()
+            if result:
+                self.game_result = result
                 self.save_pgn_game()
                 # Reset for next game
                 self.game_moves = []
                 self.game_start_fen = None
                 self.game_result = "*"
 
-    def get_best_move(self) -> Optional[chess.Move]:
-        """Calculate best move using selected engine type."""
+    def game_over_result(self) -> Optional[str]:
+        """
+        Result string ("1-0", "0-1", "1/2-1/2") if the current position ends the game, else None.
+
+        Checkmate, stalemate and insufficient material come from a single
+        board.outcome() call; fifty-move and threefold repetition draws are
+        checked on top of that.
+        """
+        outcome = self.board.outcome()
+        if outcome is not None:
+            return outcome.result()
+        if self.board.is_fifty_moves() or self.board.is_repetition():
+            return "1/2-1/2"
+        return None
+
+    def get_best_move(self, deadline: Optional[float] = None,
+                      stop_event: Optional[threading.Event] = None
+                      ) -> Tuple[Optional[chess.Move], Optional[float]]:
+        """
+        Calculate best move using selected engine type.
+
+        Args:
+            deadline: Optional time.monotonic() value at which a minimax search
+                      raises SearchStopped (other engines ignore it)
+            stop_event: Optional event that aborts minimax (SearchStopped) or
+                        ends MCTS early with its best move so far
+
+        Returns:
+            (move, score): score is the minimax root score in centipawns
+            (White's perspective), or None if the engine doesn't produce one
+            or nothing was searched. move is None if the game is over.
+        """
         if self.board.is_game_over():
-            return None
+            return None, None
 
         legal_moves = list(self.board.legal_moves)
         if not legal_moves:
-            return None
+            return None, None
+
+        # Forced move (e.g. the only check evasion): nothing to search
+        if len(legal_moves) == 1:
+            return legal_moves[0], None
+
+        search = self._engines.get(self.engine_type, self._search_random)
+        return search(legal_moves, deadline, stop_event)
+
+    def _search_random(self, legal_moves: List[chess.Move], deadline, stop_event):
+        """Random engine (also the fallback for an unknown engine type)."""
+        return self._rng.choice(legal_moves), None
+
+    def _search_material(self, legal_moves: List[chess.Move], deadline, stop_event):
+        """Greedy 1-ply material engine."""
+        if self._material_fn is None:
+            from engine.evaluator import best_move_material
+            self._material_fn = best_move_material
+        return self._material_fn(self.board, rng=self._rng), None
+
+    def _search_minimax(self, legal_moves: List[chess.Move], deadline, stop_event):
+        """Alpha-beta minimax to self.search_depth, sharing self.tt across searches."""
+        if self._minimax_fn is None:
+            from search.minimax import search_root, TranspositionTable
+            self._minimax_fn = search_root
+            self.tt = TranspositionTable()
+        return self._minimax_fn(self.board, self.search_depth, tt=self.tt,
+                                nodes_searched=self.nodes_searched, deadline=deadline,
+                                stop_event=stop_event)
+
+    def _search_mcts(self, legal_moves: List[chess.Move], deadline, stop_event):
+        """MCTS, continuing the previous tree or root-parallel across worker processes."""
+        if self._mcts_fn is None:
+            from search.mcts import best_move_mcts, best_move_mcts_parallel, subtree_for
+            self._mcts_fn = best_move_mcts
+            self._mcts_parallel_fn = best_move_mcts_parallel
+            self._mcts_subtree_fn = subtree_for
+        if self.mcts_workers > 1:
+            # Root-parallel: independent trees in worker processes
+            return self._mcts_parallel_fn(self.board,
+                                          simulations=self.mcts_simulations,
+                                          use_evaluator=self.mcts_use_evaluator,
+                                          workers=self.mcts_workers,
+                                          rng=self._rng), None
+        self.mcts_root = self._mcts_subtree_fn(self.mcts_root, self.board, rng=self._rng)
+        return self._mcts_fn(self.board,
+                             simulations=self.mcts_simulations,
+                             use_evaluator=self.mcts_use_evaluator,
+                             root=self.mcts_root,
+                             stop_event=stop_event,
+                             rng=self._rng), None
+
+    def iterative_deepening(self, max_depth: int,
+                            budget: Optional[float] = None) -> Optional[chess.Move]:
+        """
+        Run minimax at depths 1, 2, ... max_depth, reporting each iteration.
+
+        Every iteration leaves its results in self.tt, so the next, deeper
+        iteration tries the previous best moves first and prunes more. With a
+        time budget, a new iteration only starts while less than half of it
+        is used (each one costs several times the previous). An iteration
+        still running at the deadline, or when 'stop' arrives, is abandoned.
+
+        Args:
+            max_depth: Deepest iteration to run, in plies
+            budget: Optional time limit in seconds
 
-        if self.engine_type == "random":
-            return random.choice(legal_moves)
+        Returns:
+            Best move from the deepest completed iteration (None if the game is over)
+        """
+        from search.minimax import SearchStopped  # Already loaded by get_best_move
+
+        best_move = None
+        start = time.monotonic()
+        deadline = start + budget if budget is not None else None
+        stack_len = len(self.board.move_stack)
+        self.nodes_searched[0] = 0
+
+        for depth in range(1, max_depth + 1):
+            self.search_depth = depth
+            try:
+                # Depth 1 always completes so there is a move to play
+                if depth == 1:
+                    move, score = self.get_best_move()
+                else:
+                    move, score = self.get_best_move(deadline, self.stop_event)
+            except SearchStopped:
+                # Unwind the moves the abandoned search left on the board
+                while len(self.board.move_stack) > stack_len:
+                    self.board.pop()
+                break
+
+            best_move = move
+            if score is None:
+                break  # Game over or forced move: nothing was searched
+
+            elapsed = time.monotonic() - start
+            nodes = self.nodes_searched[0]
+            nps = int(nodes / elapsed) if elapsed > 0 else 0
+            # UCI scores are from the side to move; search scores are White's
+            if self.board.turn == chess.BLACK:
+                score = -score
+            self.uci_print(f"info depth {depth} score cp {int(score)} nodes {nodes} "
+                           f"nps {nps} time {int(elapsed * 1000)} pv {best_move.uci()}",
+                           flush=elapsed >= INFO_FLUSH_AFTER)
+
+            if budget is not None and elapsed > budget / 2:
+                break
+            if self.stop_event.is_set():
+                break
+
+        return best_move
+
+    def time_budget(self, params: Dict[str, int]) -> Optional[float]:
+        """
+        Decide how long to think from the 'go' parameters.
+
+        Args:
+            params: Output of parse_go_params()
+
+        Returns:
+            Seconds to spend on this move, or None if no time limit was given
+        """
+        if "movetime" in params:
+            return max(params["movetime"] - MOVE_OVERHEAD_MS, 1) / 1000
+
+        white = self.board.turn == chess.WHITE
+        time_left = params.get("wtime" if white else "btime")
+        if time_left is None:
+            return None
+        increment = params.get("winc" if white else "binc", 0)
+        moves_to_go = max(params.get("movestogo", DEFAULT_MOVES_TO_GO), 1)
 
-        elif self.engine_type == "material":
-            return best_move_material(self.board)
+        # Even share of the remaining clock plus most of the increment,
+        # never more than what is left after the overhead reserve
+        budget = time_left / moves_to_go + increment * 3 / 4
+        budget = min(budget, time_left - MOVE_OVERHEAD_MS)
+        return max(budget, 1) / 1000
 
-        elif self.engine_type == "minimax":
-            return best_move_minimax(self.board, self.search_depth)
+    def parse_go_params(self, parts: List[str]) -> Dict[str, int]:
+        """
+        Parse the arguments of a 'go' command into a dict in one pass.
 
-        elif self.engine_type == "mcts":
-            return best_move_mcts(self.board,
-                                 simulations=self.mcts_simulations,
-                                 use_evaluator=self.mcts_use_evaluator)
+        Args:
+            parts: Tokens after 'go', e.g. ["wtime", "60000", "btime", "60000"]
 
-        # Fallback
-        return random.choice(legal_moves)
+        Returns:
+            Integer parameters by name (depth, movetime, wtime, ...), plus
+            "infinite": 1 if present. Malformed values are skipped.
+        """
+        params = {}
+        tokens = iter(parts)
+        for token in tokens:
+            if token in _GO_INT_PARAMS:
+                value = next(tokens, None)
+                if value is None:
+                    break
+                try:
+                    params[token] = int(value)
+                except ValueError:
+                    self.log_debug(f"Invalid go {token} value: {value}")
+            elif token == "infinite":
+                params["infinite"] = 1
+        return params
 
     def handle_go(self, parts: list):
         """
@@ -419,30 +835,25 @@ class UCIEngine:
 
         Supported subcommands:
         - depth <n>: search to depth n
-        - movetime <ms>: search for exactly ms milliseconds
-        - infinite: search until 'stop' command
+        - movetime <ms>: search for about ms milliseconds
+        - wtime/btime <ms>, winc/binc <ms>, movestogo <n>: budget from the clock
+        - infinite: deepen until 'stop'
 
-        For now, we implement basic support.
+        Time limits apply to the minimax engine. Without a depth, a timed or
+        infinite search deepens until its budget runs out or 'stop' arrives;
+        'stop' also ends an MCTS search early.
         """
-        # Parse go parameters
-        search_depth = self.search_depth  # default from options
+        self._begin_search()
 
-        idx = 0
-        while idx < len(parts):
-            if parts[idx] == "depth":
-                try:
-                    search_depth = int(parts[idx + 1])
-                    idx += 2
-                except (ValueError, IndexError):
-                    idx += 1
-            elif parts[idx] == "movetime":
-                # We don't implement time management yet, just acknowledge
-                idx += 2
-            elif parts[idx] == "infinite":
-                # For now, treat as normal search
-                idx += 1
-            else:
-                idx += 1
+        # Parse go parameters
+        params = self.parse_go_params(parts)
+        budget = self.time_budget(params)
+        if "depth" in params:
+            search_depth = params["depth"]
+        elif budget is not None or "infinite" in params:
+            search_depth = MAX_SEARCH_DEPTH
+        else:
+            search_depth = self.search_depth  # default from options
 
         # Override search depth for this move if specified in go command
         original_depth = self.search_depth
@@ -450,7 +861,10 @@ class UCIEngine:
             self.search_depth = search_depth
 
         # Calculate best move
-        best_move = self.get_best_move()
+        if self.engine_type == "minimax":
+            best_move = self.iterative_deepening(search_depth, budget)
+        else:
+            best_move, _ = self.get_best_move(stop_event=self.stop_event)
 
         # Restore original depth
         self.search_depth = original_depth
@@ -464,31 +878,20 @@ class UCIEngine:
                 except Exception as e:
                     self.log_debug(f"Failed to convert move to SAN: {e}")
 
-            # Send evaluation info (optional but nice for GUIs)
-            if self.engine_type == "minimax":
-                score = evaluate(self.board)
-                self.uci_print(f"info depth {search_depth} score cp {score}", flush=True)
-
-            self.uci_print(f"bestmove {best_move.uci()}", flush=True)
+            self.uci_print(f"bestmove {best_move.uci()}")
 
             # Check for game over after this move (for PGN export)
             if self.pgn_export_enabled:
-                # Make the move on a copy to check game state
-                temp_board = self.board.copy()
-                temp_board.push(best_move)
-                game_ended = False
-                if temp_board.is_checkmate():
-                    self.game_result = "1-0" if temp_board.turn == chess.BLACK else "0-1"
-                    game_ended = True
-                elif temp_board.is_stalemate() or temp_board.is_insufficient_material():
-                    self.game_result = "1/2-1/2"
-                    game_ended = True
-                elif temp_board.is_fifty_moves() or temp_board.is_repetition():
-                    self.game_result = "1/2-1/2"
-                    game_ended = True
+                # Check game state with the move pushed on the live board (no copy)
+                self.board.push(best_move)
+                try:
+                    result = self.game_over_result()
+                finally:
+                    self.board.pop()
 
                 # Save the game immediately if it ended, or save incrementally
-                if game_ended:
+                if result:
+                    self.game_result = result
                     self.save_pgn_game()
                     # Reset for next game
                     self.game_moves = []
@@ -496,12 +899,13 @@ class UCIEngine:
                     self.game_result = "*"
         else:
             # No legal moves (shouldn't happen if board state is correct)
-            self.uci_print("bestmove 0000", flush=True)
+            self.uci_print("bestmove 0000")
 
     def handle_stop(self):
         """Handle 'stop' command - stop calculating."""
-        # For our simple engine, we don't support async calculation yet
-        # Just acknowledge - the GUI won't send this in our implementation
+        # Nothing to do here: the stdin reader sets stop_event as soon as
+        # 'stop' arrives, which ends the running search. By the time the main
+        # loop gets to this command the search is over.
         pass
 
     def handle_quit(self):
@@ -516,68 +920,95 @@ class UCIEngine:
 
         sys.exit(0)
 
+    def _read_stdin(self):
+        """
+        Background thread: queue stdin lines for run() (None at EOF).
+
+        Searches run on the main thread, so 'stop' and 'quit' are acted on
+        here by setting stop_event for the latest 'go'. EOF is not a stop:
+        commands already read, including a running search, are completed.
+        """
+        for line in iter(sys.stdin.readline, ""):
+            # Same command word as run() dispatches on (any whitespace separates)
+            command = line.split(None, 1)[:1]
+            if command == ["go"]:
+                with self._stop_lock:
+                    self._go_read += 1
+            elif command == ["stop"] or command == ["quit"]:
+                self._request_stop()
+            self.input_q.put(line)
+        self.input_q.put(None)
+
+    def _request_stop(self):
+        """Stop the search of the last 'go' read, now or as soon as it starts."""
+        with self._stop_lock:
+            self._stop_target = self._go_read
+            if self._go_started == self._go_read:
+                self.stop_event.set()
+
+    def _begin_search(self):
+        """Arm stop_event for a new 'go': set only if its stop already arrived."""
+        with self._stop_lock:
+            self._go_started += 1
+            if self._stop_target == self._go_started:
+                self.stop_event.set()
+            else:
+                self.stop_event.clear()
+
     def run(self):
         """Main UCI loop - read commands and respond."""
+        # Block-buffered stdout: uci_print flushes only on responses the GUI
+        # waits for (uciok, readyok, bestmove), so info lines ride along
+        if hasattr(sys.stdout, "reconfigure"):
+            sys.stdout.reconfigure(line_buffering=False)
+
+        # Read stdin on a separate thread so 'stop' is seen during a search
+        threading.Thread(target=self._read_stdin, daemon=True).start()
+        next_line = self.input_q.get
+
         self.log_debug("UCI engine started")
 
         while True:
             try:
-                line = input().strip()
-                if not line:
+                # Make sure the log is current before blocking on the GUI
+                self._flush_uci_log()
+                line = next_line()
+                if line is None:
+                    break  # EOF: GUI closed connection
+                line = line.rstrip("\r\n")
+
+                # Fast path: bare commands (isready, ucinewgame, stop, ...) need no split
+                handler = self._cmd_handlers.get(line)
+                if handler is not None:
+                    self.log_uci_transaction("IN", line)
+                    handler("")
+                    continue
+
+                # Split off the command only; handlers parse the rest themselves
+                parts = line.split(None, 1)
+                if not parts:
                     continue
 
                 # Log incoming command
                 self.log_uci_transaction("IN", line)
 
-                parts = line.split()
                 command = parts[0]
-                args = parts[1:]
-
-                if command == "uci":
-                    self.handle_uci()
-
-                elif command == "debug":
-                    if args and args[0] == "on":
-                        self.handle_debug(True)
-                    else:
-                        self.handle_debug(False)
-
-                elif command == "isready":
-                    self.handle_isready()
-
-                elif command == "setoption":
-                    # Parse: setoption name <name> value <value>
-                    if len(args) >= 4 and args[0] == "name" and "value" in args:
-                        value_idx = args.index("value")
-                        name = " ".join(args[1:value_idx])
-                        value = " ".join(args[value_idx+1:])
-                        self.handle_setoption(name, value)
-
-                elif command == "ucinewgame":
-                    self.handle_ucinewgame()
-
-                elif command == "position":
-                    self.handle_position(args)
-
-                elif command == "go":
-                    self.handle_go(args)
-
-                elif command == "stop":
-                    self.handle_stop()
-
-                elif command == "quit":
-                    self.handle_quit()
-
+                handler = self._cmd_handlers.get(command)
+                if handler is not None:
+                    handler(parts[1] if len(parts) > 1 else "")
                 else:
                     self.log_debug(f"Unknown command: {command}")
 
-            except EOFError:
-                # GUI closed connection
-                break
             except Exception as e:
-                self.log_debug(f"Error: {e}")
-                import traceback
-                self.log_debug(traceback.format_exc())
+                # Only pay for formatting the traceback when someone will see it
+                if self.debug:
+                    self.log_debug(f"Error: {e}")
+                    self.log_debug(traceback.format_exc())
+                else:
+                    self.uci_print(f"info string ERROR: {type(e).__name__}: {e}")
+
+        # Don't lose buffered log lines if the GUI closed stdin without 'quit'
+        self._flush_uci_log()
 
 
 def main():